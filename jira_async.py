@@ -7,18 +7,29 @@ resulting in 10-20x performance improvements over sequential requests.
 
 import asyncio
 import ssl
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 import aiohttp
 from aiohttp import BasicAuth, ClientTimeout
 
 
+@lru_cache(maxsize=4)
+def _ca_bundle_ssl_context(cafile: str) -> ssl.SSLContext:
+    """Return an SSL context trusting the given CA bundle (e.g. Zscaler.pem).
+
+    The PEM file is read and parsed once per process, not on every batch fetch.
+    """
+    return ssl.create_default_context(cafile=cafile)
+
+
 async def fetch_epic_batch_async(
     jira_url: str,
     epic_keys: List[str],
     auth: Tuple[str, str],
     ssl_verify,
     fields: Optional[List[str]] = None,
-    max_concurrent: int = 10
+    max_concurrent: int = 10,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Dict[str, Optional[dict]]:
     """Fetch multiple epics concurrently for massive performance improvement.
 
@@ -37,6 +48,8 @@ async def fetch_epic_batch_async(
         ssl_verify: SSL verification setting (True, False, or path to cert file)
         fields: Optional list of fields to fetch (defaults to common epic fields)
         max_concurrent: Maximum number of concurrent requests (default: 10)
+        session: Optional open aiohttp session to reuse (its connector and SSL setup);
+                 left open afterwards. By default a session is created for this call.
 
     Returns:
         Dict mapping epic_key → issue JSON dict
@@ -76,7 +89,7 @@ async def fetch_epic_batch_async(
         ssl_context.verify_mode = ssl.CERT_NONE
     elif isinstance(ssl_verify, str):
         # Custom certificate file path
-        ssl_context = ssl.create_default_context(cafile=ssl_verify)
+        ssl_context = _ca_bundle_ssl_context(ssl_verify)
     # If ssl_verify is True or None, use default context (handled by aiohttp)
 
     # Configure connection timeout (15 seconds per request)
@@ -96,7 +109,8 @@ async def fetch_epic_batch_async(
         async with semaphore:  # Limit concurrent requests
             for attempt in range(3):  # Retry up to 3 times
                 try:
-                    async with session.get(url, params=params, timeout=timeout) as resp:
+                    # Auth is sent per request so a caller-supplied session works as well
+                    async with session.get(url, params=params, timeout=timeout, auth=basic_auth) as resp:
                         if resp.status == 200:
                             data = await resp.json()
                             return (key, data)
@@ -123,21 +137,21 @@ async def fetch_epic_batch_async(
             # All retries exhausted
             return (key, None)
 
+    if session is not None:
+        results = await asyncio.gather(*(fetch_single_epic(session, key) for key in epic_keys))
+        return dict(results)
+
     # Create aiohttp session and fetch all epics concurrently
-    connector = aiohttp.TCPConnector(limit=max_concurrent, limit_per_host=max_concurrent)
+    connector_kwargs = {"limit": max_concurrent, "limit_per_host": max_concurrent}
+    if ssl_context:
+        # The connector applies the custom context to every connection it opens
+        connector_kwargs["ssl"] = ssl_context
+    connector = aiohttp.TCPConnector(**connector_kwargs)
 
     async with aiohttp.ClientSession(
-        auth=basic_auth,
         connector=connector,
         timeout=timeout
     ) as session:
-        # If custom SSL context, pass it to requests
-        if ssl_context:
-            # Note: aiohttp doesn't support passing ssl_context to session
-            # We need to pass it per request, but we'll handle this differently
-            # For now, rely on environment SSL settings
-            pass
-
         # Fetch all epics concurrently
         tasks = [fetch_single_epic(session, key) for key in epic_keys]
         results = await asyncio.gather(*tasks)
@@ -207,7 +221,8 @@ async def fetch_issues_batch_async(
     auth: Tuple[str, str],
     ssl_verify,
     fields: Optional[List[str]] = None,
-    max_concurrent: int = 10
+    max_concurrent: int = 10,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Dict[str, Optional[dict]]:
     """Fetch multiple issues concurrently (generic version).
 
@@ -220,6 +235,7 @@ async def fetch_issues_batch_async(
         ssl_verify: SSL verification setting
         fields: Optional list of fields to fetch
         max_concurrent: Max concurrent requests
+        session: Optional open aiohttp session to reuse (see fetch_epic_batch_async)
 
     Returns:
         Dict mapping issue_key → issue JSON (or None if failed)
@@ -234,7 +250,7 @@ async def fetch_issues_batch_async(
     """
     # Reuse epic fetching logic (works for any issue type)
     return await fetch_epic_batch_async(
-        jira_url, issue_keys, auth, ssl_verify, fields, max_concurrent
+        jira_url, issue_keys, auth, ssl_verify, fields, max_concurrent, session
     )
 
 
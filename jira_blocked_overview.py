@@ -1,6 +1,7 @@
 import requests
 
 from jira_config import load_jira_env, get_ssl_verify, get_jira_session
+from jira_performance import decode_json_response
 
 JIRA_ENV = load_jira_env()
 JIRA_URL = JIRA_ENV.get("JT_JIRA_URL", "https://equinixjira.atlassian.net/").rstrip("/")
@@ -25,7 +26,7 @@ def get_blocked_stories():
         }
         resp = _JIRA_SESSION.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = decode_json_response(resp)
         issues.extend(data["issues"])
         if start_at + 50 >= data["total"]:
             break
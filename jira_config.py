@@ -6,6 +6,7 @@ Centralizes the parsing logic that multiple scripts previously duplicated.
 from __future__ import annotations
 
 import os
+import re
 import warnings
 from functools import lru_cache
 from pathlib import Path
@@ -14,40 +15,50 @@ from typing import Dict, Optional, Union
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_ENV_PATH = BASE_DIR / ".jira_environment"
 
 
-def _parse_line(line: str, data: Dict[str, str]) -> None:
-    """Parse a single export-style line into the provided dict."""
-    stripped = line.strip()
-    if not stripped or stripped.startswith("#"):
-        return
-    if stripped.startswith("export "):
-        stripped = stripped[len("export ") :].strip()
-    if "=" not in stripped:
-        return
-    key, value = stripped.split("=", 1)
-    data[key.strip()] = value.strip().strip('"').strip("'")
+# One export-style assignment per line (optional "export " prefix); blank and
+# comment lines never match because the key must start with a non-space, non-# char
+_ENV_LINE_RE = re.compile(r"^[ \t]*(?:export[ \t]+)?([^#=\s][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
 
 
-@lru_cache(maxsize=4)
 def load_jira_env(env_path: Optional[Path] = None) -> Dict[str, str]:
-    """Return the parsed Jira environment variables from .jira_environment."""
+    """Return the parsed Jira environment variables from .jira_environment.
+
+    The file is parsed once per modification: repeated calls only stat it, and an
+    edited file (e.g. between menu actions) is picked up on the next call.
+    """
     path = Path(env_path) if env_path else DEFAULT_ENV_PATH
-    env: Dict[str, str] = {}
-    if path.exists():
-        with path.open() as fh:
-            for line in fh:
-                _parse_line(line, env)
-    return env
+    mtime_ns = _env_file_mtime_ns(path)
+    if mtime_ns is None:
+        return {}
+    return _parse_env_file(path, mtime_ns)
+
+
+def _env_file_mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _parse_env_file(path: Path, mtime_ns: int) -> Dict[str, str]:
+    """Parse an env file; ``mtime_ns`` is only part of the cache key."""
+    # Read the file in one go and parse it with a single regex pass
+    return {
+        key: value.strip().strip('"').strip("'")
+        for key, value in _ENV_LINE_RE.findall(path.read_text())
+    }
 
 
 def get_jira_setting(key: str, default: Optional[str] = None, env_path: Optional[Path] = None) -> Optional[str]:
     """Convenience accessor for a single config value."""
-    env = load_jira_env(env_path=env_path)
-    return env.get(key, default)
+    return load_jira_env(env_path).get(key, default)
 
 
 def get_ssl_verify() -> Union[bool, str]:
@@ -82,6 +93,20 @@ def get_ssl_verify() -> Union[bool, str]:
     if not ssl_verify:
         return True
 
+    verify = _SSL_VERIFY_BY_VALUE.get(ssl_verify)
+    if verify is None:
+        verify = _resolve_ssl_verify(ssl_verify)
+    return verify
+
+
+# Resolved verify settings by raw setting value. Every tool asks at import time; only
+# successful resolutions are stored, so a missing certificate path is checked (and warned
+# about) again on every call and a certificate created later is picked up.
+_SSL_VERIFY_BY_VALUE: Dict[str, Union[bool, str]] = {}
+
+
+def _resolve_ssl_verify(ssl_verify: str) -> Union[bool, str]:
+    """Turn a JT_SSL_VERIFY value into a requests ``verify`` argument."""
     # Parse the value
     ssl_verify_lower = ssl_verify.strip().lower()
 
@@ -100,6 +125,7 @@ def get_ssl_verify() -> Union[bool, str]:
 
     # Check for boolean true
     if ssl_verify_lower in ('true', '1', 'yes', 'on', 'enabled'):
+        _SSL_VERIFY_BY_VALUE[ssl_verify] = True
         return True
 
     # Otherwise treat as file path - expand ~ and make absolute
@@ -109,7 +135,8 @@ def get_ssl_verify() -> Union[bool, str]:
         cert_path = BASE_DIR / cert_path
 
     if cert_path.exists():
-        return str(cert_path.resolve())
+        verify = _SSL_VERIFY_BY_VALUE[ssl_verify] = str(cert_path.resolve())
+        return verify
 
     # If path doesn't exist, log warning and default to True
     print(f"Warning: SSL certificate path does not exist: {cert_path}")
@@ -117,7 +144,7 @@ def get_ssl_verify() -> Union[bool, str]:
     return True
 
 
-@lru_cache(maxsize=1)
+
 def get_jira_session() -> requests.Session:
     """Return a configured requests.Session for Jira API calls.
 
@@ -125,21 +152,29 @@ def get_jira_session() -> requests.Session:
     - Automatic retry logic for 5xx errors, network failures, rate limits
     - Pre-configured authentication from .jira_environment
     - SSL verification based on get_ssl_verify()
-    - Connection pooling for performance (10 connections, 20 max)
+    - Connection pooling for performance (10 pools, 32 connections per host)
+    - Compressed JSON responses (gzip/deflate, plus br/zstd when brotli/zstandard are installed)
     - Exponential backoff: 1s, 2s, 4s, 8s (4 retries)
 
     Returns:
-        Configured requests.Session instance (singleton per process)
+        Configured requests.Session instance, shared until .jira_environment changes
+        (a later call after an edit builds a new session with the new credentials)
 
     Example:
         >>> session = get_jira_session()
         >>> resp = session.get(url, timeout=15)
     """
+    return _build_jira_session(DEFAULT_ENV_PATH, _env_file_mtime_ns(DEFAULT_ENV_PATH))
+
+
+@lru_cache(maxsize=1)
+def _build_jira_session(env_path: Path, env_mtime_ns: Optional[int]) -> requests.Session:
+    """Build the session for get_jira_session(); the arguments only key the cache."""
     session = requests.Session()
 
     # Configure retry logic with urllib3
     retry_strategy = Retry(
-        total=4,                      # Max retry attempts (matches current jira_get)
+        total=4,                      # Max retry attempts
         backoff_factor=1.0,           # Exponential: 1s, 2s, 4s, 8s
         status_forcelist=[500, 502, 503, 504, 429],  # Server errors + rate limit
         allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
@@ -149,13 +184,13 @@ def get_jira_session() -> requests.Session:
     adapter = HTTPAdapter(
         max_retries=retry_strategy,
         pool_connections=10,    # Number of connection pools
-        pool_maxsize=20         # Connections per pool
+        pool_maxsize=32         # Connections per pool: covers the concurrent page fetchers (3 x 8 workers)
     )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
     # Configure authentication
-    env = load_jira_env()
+    env = load_jira_env(env_path)
     username = env.get("JT_JIRA_USERNAME")
     api_token = env.get("JT_JIRA_PASSWORD")
     if username and api_token:
@@ -164,8 +199,18 @@ def get_jira_session() -> requests.Session:
     # Configure SSL verification
     session.verify = get_ssl_verify()
 
+    # Ask for compressed JSON; urllib3 only advertises encodings it can decode
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+    })
+
     import logging
     logger = logging.getLogger(__name__)
     logger.debug("Initialized Jira session with retry logic and connection pooling")
 
     return session
+
+
+# Callers (and tests) reset the shared session through get_jira_session.cache_clear()
+get_jira_session.cache_clear = _build_jira_session.cache_clear
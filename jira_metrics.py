@@ -4,13 +4,22 @@ Shared helpers for Jira sprint metrics (used by velocity/forecast features).
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
 import requests
 from jira_config import get_ssl_verify, get_jira_session
+from jira_performance import CLOSED_SPRINT_CACHE_TTL, SPRINT_LIST_CACHE_TTL, cached_get_json
 
-# Shared session for all Jira API calls
-_JIRA_SESSION = get_jira_session()
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent page requests per sprint (session pool holds 32 connections)
+PAGE_FETCH_WORKERS = 8
+
+DONE_STATUSES = frozenset(("done", "closed", "resolved"))
+# Placeholder values Jira uses for unset numeric fields
+_EMPTY_VALUES = (None, "", "?")
 
 
 def get_recent_sprints(
@@ -24,17 +33,17 @@ def get_recent_sprints(
 ) -> List[Dict]:
     """Return recent sprints for the board sorted descending by end date.
 
+    The sprint list is served from the on-disk cache (when enabled) for up to 10 minutes.
+
     Args:
         auth: DEPRECATED - auth now comes from session
         verify: DEPRECATED - SSL config now comes from session
-        session: Optional session to use (defaults to shared _JIRA_SESSION)
+        session: Optional session to use (defaults to the shared get_jira_session())
     """
     if session is None:
-        session = _JIRA_SESSION
+        session = get_jira_session()
     url = f"{jira_url}/rest/agile/1.0/board/{board_id}/sprint?state={state}"
-    resp = session.get(url, timeout=15)
-    resp.raise_for_status()
-    sprints = resp.json().get("values", [])
+    sprints = cached_get_json(session, url, ttl=SPRINT_LIST_CACHE_TTL).get("values", [])
     sprints = [s for s in sprints if s.get("endDate")]
     sprints.sort(key=lambda s: s["endDate"], reverse=True)
     return sprints[:max_results]
@@ -44,57 +53,71 @@ def get_sprint_issues(
     jira_url: str,
     sprint_id: int,
     auth: Tuple[str, str] = None,  # Deprecated
-    page_size: int = 50,
+    page_size: int = 500,
     verify: Union[bool, str, None] = None,  # Deprecated
     session: requests.Session = None,  # New
+    fields: Sequence[str] = None,
+    cache_ttl: int = None,
 ) -> List[Dict]:
     """Return all issues in the given sprint.
 
+    The first page is fetched to learn the total; the remaining pages are then
+    fetched concurrently and appended in startAt order. Jira may return fewer
+    than ``page_size`` issues per page; the offsets follow the size it returns.
+
     Args:
         auth: DEPRECATED - auth now comes from session
         verify: DEPRECATED - SSL config now comes from session
-        session: Optional session to use (defaults to shared _JIRA_SESSION)
+        session: Optional session to use (defaults to the shared get_jira_session())
+        fields: Optional field ids to request (default: all fields)
+        cache_ttl: Max age for responses from the on-disk cache, when enabled (default: its TTL)
     """
     if session is None:
-        session = _JIRA_SESSION
+        session = get_jira_session()
     url = f"{jira_url}/rest/agile/1.0/sprint/{sprint_id}/issue"
-    issues: List[Dict] = []
-    start_at = 0
-    while True:
-        params = {"startAt": start_at, "maxResults": page_size}
-        resp = session.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        issues.extend(data["issues"])
-        if start_at + page_size >= data["total"]:
-            break
-        start_at += page_size
+    base_params = {"maxResults": page_size}
+    if fields:
+        base_params["fields"] = ",".join(fields)
+
+    def fetch_page(start_at: int) -> Dict:
+        return cached_get_json(session, url, params={**base_params, "startAt": start_at}, ttl=cache_ttl)
+
+    first = fetch_page(0)
+    issues: List[Dict] = list(first["issues"])
+    returned = len(issues)
+    if not returned or returned >= first["total"]:
+        return issues
+    if returned < page_size:
+        logger.debug("Jira capped sprint issue pages at %d (asked for %d)", returned, page_size)
+    offsets = range(returned, first["total"], returned)
+    with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(offsets))) as pool:
+        for data in pool.map(fetch_page, offsets):
+            issues.extend(data["issues"])
     return issues
 
 
 def achieved_points_and_time(issues: Iterable[Dict], story_points_field: str) -> Tuple[float, int]:
-    """Sum completed story points and logged time for the provided issues."""
+    """Sum completed story points and logged time for the provided issues (single pass)."""
     points = 0.0
     time_logged = 0
-    DONE_STATUSES = {"done", "closed", "resolved"}
     for issue in issues:
         fields = issue.get("fields", {})
         status = (fields.get("status", {}) or {}).get("name", "").lower()
         if status not in DONE_STATUSES:
             continue
         story_points = fields.get(story_points_field)
-        if story_points not in (None, "", "?"):
+        if story_points not in _EMPTY_VALUES:
             try:
                 points += float(story_points)
-            except Exception:
+            except (TypeError, ValueError):
                 pass
         timetracking = fields.get("timetracking")
         if isinstance(timetracking, dict):
             spent = timetracking.get("timeSpentSeconds")
-            if spent not in (None, "", "?"):
+            if spent not in _EMPTY_VALUES:
                 try:
                     time_logged += int(spent)
-                except Exception:
+                except (TypeError, ValueError):
                     pass
     return points, time_logged
 
@@ -110,7 +133,14 @@ def build_velocity_history(
     history = []
     sprints = get_recent_sprints(jira_url, board_id, auth, state="closed", max_results=max_sprints)
     for sprint in sprints:
-        issues = get_sprint_issues(jira_url, sprint["id"], auth)
+        # achieved_points_and_time only reads these fields
+        issues = get_sprint_issues(
+            jira_url,
+            sprint["id"],
+            auth,
+            fields=("status", story_points_field, "timetracking"),
+            cache_ttl=CLOSED_SPRINT_CACHE_TTL,
+        )
         points, time_logged = achieved_points_and_time(issues, story_points_field)
         history.append(
             {
@@ -4,10 +4,57 @@ Performance utilities for Jira API interactions.
 Provides caching and optimized date parsing to reduce API calls and CPU overhead.
 """
 
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
 from functools import lru_cache
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, Dict
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of large issue payloads
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_DIR = Path(os.environ.get("JPT_CACHE_DIR") or Path(__file__).resolve().parent / ".jpt_cache")
+DEFAULT_RESPONSE_CACHE_TTL = 900  # seconds
+# Closed sprints no longer change, so their issues can be reused much longer
+CLOSED_SPRINT_CACHE_TTL = 24 * 3600  # seconds
+# Board sprint lists only change when a sprint is started, closed or planned
+SPRINT_LIST_CACHE_TTL = 600  # seconds
+# Epic -> initiative links are edited rarely
+EPIC_PARENT_CACHE_TTL = 24 * 3600  # seconds
+
+# On-disk response cache state; disabled until enable_response_cache() is called
+_RESPONSE_CACHE: Dict = {"dir": None, "ttl": DEFAULT_RESPONSE_CACHE_TTL}
+
+# Requests currently on the wire, keyed like the response cache; concurrent
+# identical calls to cached_get_json() wait for the first one instead of re-fetching
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def json_loads(raw):
+    """Decode JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def decode_json_response(resp) -> Dict:
+    """Decode a requests response body; same result as ``resp.json()``, only faster with orjson."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
 @lru_cache(maxsize=128)
 def parse_iso8601_datetime(iso_string: str) -> Optional[datetime]:
@@ -160,3 +207,186 @@ def get_cache_stats() -> Dict[str, Dict]:
         'sprint_cache': get_cached_sprint_metadata.cache_info(),
         'date_cache': parse_iso8601_datetime.cache_info(),
     }
+
+
+def enable_response_cache(cache_dir: Optional[Path] = None, ttl: int = DEFAULT_RESPONSE_CACHE_TTL) -> Path:
+    """Enable the persistent on-disk cache used by cached_get_json().
+
+    The cache is off by default so library imports (and tests) never read stale
+    data from disk; CLI entry points opt in explicitly.
+
+    Args:
+        cache_dir: Directory for cached responses (defaults to $JPT_CACHE_DIR, else .jpt_cache
+            next to the scripts)
+        ttl: Maximum age in seconds before a cached response is refetched
+
+    Returns:
+        The cache directory in use
+    """
+    path = Path(cache_dir) if cache_dir else DEFAULT_RESPONSE_CACHE_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    _RESPONSE_CACHE["dir"] = path
+    _RESPONSE_CACHE["ttl"] = ttl
+    return path
+
+
+def disable_response_cache() -> None:
+    """Disable the on-disk response cache (cached files are left in place)."""
+    _RESPONSE_CACHE["dir"] = None
+
+
+def clear_response_cache() -> None:
+    """Delete all cached responses from the active cache directory."""
+    cache_dir = _RESPONSE_CACHE["dir"]
+    if cache_dir is None or not cache_dir.exists():
+        return
+    for entry in cache_dir.glob("*.json"):
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+def _response_cache_key(url: str, params: Optional[Dict]) -> str:
+    """Return a stable cache key for a URL + query params combination."""
+    canonical = json.dumps([url, sorted((params or {}).items())], default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def cached_get_json(
+    session, url: str, params: Optional[Dict] = None, timeout: int = 15, ttl: Optional[int] = None
+) -> Dict:
+    """GET a Jira URL and return the parsed JSON, using the on-disk cache when enabled.
+
+    Responses are keyed by URL + params and reused until they are older than the
+    configured TTL. When the cache is disabled this is a plain session GET.
+    Concurrent calls for the same URL + params share a single request.
+
+    Args:
+        session: requests.Session to use for the request (e.g. get_jira_session())
+        url: Full Jira REST URL
+        params: Optional query parameters
+        timeout: Request timeout in seconds
+        ttl: Maximum cache age in seconds for this call (defaults to the configured TTL)
+
+    Returns:
+        Parsed JSON response (callers coalesced onto one request get the same object)
+
+    Raises:
+        requests.HTTPError: If the request fails (errors are never cached)
+
+    Examples:
+        >>> enable_response_cache()
+        >>> data = cached_get_json(session, f"{jira_url}/rest/agile/1.0/sprint/123/issue")
+        >>> # Re-running within the TTL serves the response from .jpt_cache
+    """
+    key = _response_cache_key(url, params)
+    cache_dir = _RESPONSE_CACHE["dir"]
+    path = None
+    if cache_dir is not None:
+        path = cache_dir / f"{key}.json"
+        try:
+            max_age = _RESPONSE_CACHE["ttl"] if ttl is None else ttl
+            if time.time() - path.stat().st_mtime < max_age:
+                return json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _INFLIGHT[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        resp = session.get(url, params=params, timeout=timeout)
+        resp.raise_for_status()
+        data = decode_json_response(resp)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(data)
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+    if path is not None:
+        try:
+            _write_json_atomic(path, data)
+        except OSError:
+            logger.debug("Could not write response cache entry for %s", url, exc_info=True)
+    return data
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write JSON to a temp file and rename, so concurrent readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def load_cached_entries(name: str, ttl: int) -> Dict:
+    """Return the entries of a named key/value store in the response cache directory.
+
+    Only entries stored less than ``ttl`` seconds ago are returned. The store lives
+    next to the cached responses, so it is empty while the response cache is disabled.
+
+    Args:
+        name: Store name (file ``<name>.json`` in the cache directory)
+        ttl: Maximum age in seconds of the entries to return
+
+    Returns:
+        dict of key -> value for the entries that are still fresh
+
+    Examples:
+        >>> store_cached_entries("epic_parents", {"PROJ-1": {"parent": "EMSS-7"}})
+        >>> load_cached_entries("epic_parents", ttl=EPIC_PARENT_CACHE_TTL)
+        {'PROJ-1': {'parent': 'EMSS-7'}}
+    """
+    cache_dir = _RESPONSE_CACHE["dir"]
+    if cache_dir is None:
+        return {}
+    try:
+        stored = json_loads((cache_dir / f"{name}.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    cutoff = time.time() - ttl
+    return {
+        key: entry["value"]
+        for key, entry in stored.items()
+        if isinstance(entry, dict) and entry.get("ts", 0) > cutoff and "value" in entry
+    }
+
+
+def store_cached_entries(name: str, entries: Dict) -> None:
+    """Add or refresh entries in a named key/value store (no-op while the cache is disabled).
+
+    Entries already in the store are kept; concurrent writers can lose each other's
+    additions but never corrupt the file.
+    """
+    cache_dir = _RESPONSE_CACHE["dir"]
+    if cache_dir is None or not entries:
+        return
+    path = cache_dir / f"{name}.json"
+    try:
+        stored = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        stored = {}
+    now = time.time()
+    for key, value in entries.items():
+        stored[key] = {"ts": now, "value": value}
+    try:
+        _write_json_atomic(path, stored)
+    except (OSError, TypeError, ValueError):
+        logger.debug("Could not write cache store %s", name, exc_info=True)
@@ -2,6 +2,7 @@ import argparse
 
 import requests
 from jira_config import load_jira_env, get_ssl_verify, get_jira_session
+from jira_performance import decode_json_response
 from jira_security import sanitize_jql_value
 
 JIRA_ENV = load_jira_env()
@@ -25,7 +26,8 @@ LABEL_ORDER = [
     "S&A_MGT",
     "FIMS",
 ]
-label_order_lower = [l.lower() for l in LABEL_ORDER]
+# Lower-case label -> canonical spelling, for set lookups
+LABEL_BY_LOWER = {l.lower(): l for l in LABEL_ORDER}
 
 def get_board_filter_id():
     """Return the board filter id so JQL searches match board scope (backlog + sprints)."""
@@ -57,7 +59,7 @@ def jira_search(jql, fields, start_at=0, max_results=50):
             try:
                 resp = _JIRA_SESSION.post(endpoint, json=payload, headers=headers, timeout=15)
                 if resp.status_code == 200:
-                    return resp.json()
+                    return decode_json_response(resp)
                 last_error = f"{resp.status_code}: {resp.text}"
                 if resp.status_code == 410:
                     continue
@@ -77,9 +79,9 @@ def get_ready_items():
             "maxResults": 50,
             "fields": f"summary,description,issuetype,labels,{FIELD_ACCEPTANCE_CRITERIA}"
         }
-        resp = requests.get(url, params=params, auth=(JIRA_EMAIL, JIRA_API_TOKEN), verify=SSL_VERIFY)
+        resp = _JIRA_SESSION.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = decode_json_response(resp)
         issues.extend(data["issues"])
         if start_at + 50 >= data["total"]:
             break
@@ -144,11 +146,7 @@ def has_description(fields):
     return True
 
 def has_valid_label(fields):
-    labels = [l.lower() for l in fields.get("labels", [])]
-    for label in label_order_lower:
-        if label in labels:
-            return True
-    return False
+    return any(l.lower() in LABEL_BY_LOWER for l in fields.get("labels", ()))
 
 def is_severely_invalid(fields):
     return (not has_acceptance_criteria(fields)) and (not has_valid_label(fields)) and (not has_description(fields))
@@ -159,11 +157,7 @@ def normalize_label(label_input):
     stripped = label_input.strip()
     if not stripped:
         return None
-    lower = stripped.lower()
-    for label in LABEL_ORDER:
-        if label.lower() == lower:
-            return label
-    return stripped
+    return LABEL_BY_LOWER.get(stripped.lower(), stripped)
 
 def update_story_labels(issue_key, labels):
     sanitized = []
@@ -393,25 +387,27 @@ def print_results(issues):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Check 'Ready' stories for missing acceptance criteria and valid labels.")
     parser.add_argument("--fix-labels", action="store_true", help="Interactively add a valid label to stories that are missing one.")
+    parser.add_argument("--report-only", action="store_true", help="Print the results without prompting for fixes.")
     args = parser.parse_args()
 
     issues = get_ready_items()
     print_results(issues)
     severe_stories = collect_severely_invalid_stories([i for i in issues if i["fields"]["issuetype"]["name"].lower() == "story"])
-    prompt_move_to_refine(severe_stories)
-    skip_keys = {issue["key"] for issue in severe_stories}
-    filtered_issues = [issue for issue in issues if issue["key"] not in skip_keys]
-    missing_label_stories = collect_missing_label_stories(filtered_issues)
-    missing_label_epics = collect_missing_label_epics(filtered_issues)
-    if args.fix_labels:
-        interactive_label_fix(missing_label_stories)
-        interactive_epic_label_fix(missing_label_epics)
-    elif missing_label_stories:
-        resp = input("\nOne or more 'Ready' stories are missing a valid label. Add them now? [y/N]: ").strip().lower()
-        if resp in ("y", "yes"):
+    if not args.report_only:
+        prompt_move_to_refine(severe_stories)
+        skip_keys = {issue["key"] for issue in severe_stories}
+        filtered_issues = [issue for issue in issues if issue["key"] not in skip_keys]
+        missing_label_stories = collect_missing_label_stories(filtered_issues)
+        missing_label_epics = collect_missing_label_epics(filtered_issues)
+        if args.fix_labels:
             interactive_label_fix(missing_label_stories)
-    if missing_label_epics:
-        resp = input("\nOne or more 'Ready' epics are missing a valid label. Add them now? [y/N]: ").strip().lower()
-        if resp in ("y", "yes"):
             interactive_epic_label_fix(missing_label_epics)
-    prompt_move_to_refine(severe_stories)
+        elif missing_label_stories:
+            resp = input("\nOne or more 'Ready' stories are missing a valid label. Add them now? [y/N]: ").strip().lower()
+            if resp in ("y", "yes"):
+                interactive_label_fix(missing_label_stories)
+        if missing_label_epics:
+            resp = input("\nOne or more 'Ready' epics are missing a valid label. Add them now? [y/N]: ").strip().lower()
+            if resp in ("y", "yes"):
+                interactive_epic_label_fix(missing_label_epics)
+        prompt_move_to_refine(severe_stories)
@@ -3,6 +3,7 @@ from collections import Counter, defaultdict
 
 import requests
 from jira_config import load_jira_env, get_ssl_verify, get_jira_session
+from jira_performance import decode_json_response
 from jira_security import sanitize_jql_value
 
 JIRA_ENV = load_jira_env()
@@ -47,7 +48,7 @@ def jira_search(jql, fields, start_at=0, max_results=50):
             try:
                 resp = _JIRA_SESSION.post(endpoint, json=payload, headers=headers, timeout=15)
                 if resp.status_code == 200:
-                    return resp.json()
+                    return decode_json_response(resp)
                 last_error = f"{resp.status_code}: {resp.text}"
                 # 410 means deprecated endpoint; try next payload/endpoint
                 if resp.status_code == 410:
@@ -72,7 +73,7 @@ def get_to_refine_issues():
         }
         resp = _JIRA_SESSION.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = decode_json_response(resp)
         issues.extend(data["issues"])
         if start_at + 50 >= data["total"]:
             break
@@ -327,6 +328,7 @@ def interactive_epic_label_fix(epics_missing_label):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Check 'To Refine' Epics/Stories and optionally fix missing labels.")
     parser.add_argument("--fix-labels", action="store_true", help="Interactively add labels to stories missing them.")
+    parser.add_argument("--report-only", action="store_true", help="Print the results without prompting for fixes.")
     args = parser.parse_args()
 
     issues = get_to_refine_issues()
@@ -336,14 +338,15 @@ if __name__ == "__main__":
     missing_label_stories = collect_stories_missing_labels(grouped)
     missing_label_epics = collect_epics_missing_labels(grouped)
 
-    if args.fix_labels:
-        interactive_label_fix(grouped, missing_label_stories)
-        interactive_epic_label_fix(missing_label_epics)
-    elif missing_label_stories:
-        resp = input("\nOne or more stories are missing labels. Add them now? [y/N]: ").strip().lower()
-        if resp in ("y", "yes"):
+    if not args.report_only:
+        if args.fix_labels:
             interactive_label_fix(grouped, missing_label_stories)
-    if missing_label_epics:
-        resp = input("\nOne or more epics are missing labels. Add them now? [y/N]: ").strip().lower()
-        if resp in ("y", "yes"):
             interactive_epic_label_fix(missing_label_epics)
+        elif missing_label_stories:
+            resp = input("\nOne or more stories are missing labels. Add them now? [y/N]: ").strip().lower()
+            if resp in ("y", "yes"):
+                interactive_label_fix(grouped, missing_label_stories)
+        if missing_label_epics:
+            resp = input("\nOne or more epics are missing labels. Add them now? [y/N]: ").strip().lower()
+            if resp in ("y", "yes"):
+                interactive_epic_label_fix(missing_label_epics)
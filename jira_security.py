@@ -6,8 +6,36 @@ Provides JQL injection prevention and sensitive data redaction for logging.
 
 import re
 import logging
+import weakref
+from functools import lru_cache
 from typing import List
 
+# JQL validation patterns, compiled once at import
+_ISSUE_KEY_RE = re.compile(r'^[A-Z][A-Z0-9]*-\d+$')
+# Labels: alphanumeric, hyphen, underscore, ampersand (for S&A_MGT, S&A-MPC)
+_LABEL_RE = re.compile(r'^[a-zA-Z0-9\-_&]+$')
+# Free-form text: JQL keywords/operators (IS NOT, WAS IN are covered by IS, WAS) and special chars
+_JQL_TEXT_DANGER_RE = re.compile(r'\b(?:AND|OR|NOT|IN|IS|WAS)\b|[<>=!~()\[\]]', re.IGNORECASE)
+# Backslash-escapes both quote characters in one pass over the text
+_QUOTE_ESCAPE = str.maketrans({'"': '\\"', "'": "\\'"})
+
+
+class SafeStr(str):
+    """A sanitized JQL value that SensitiveDataFilter can log without scanning.
+
+    sanitize_jql_value only returns one when the value contains nothing the filter
+    would redact; string operations on it return plain str again.
+    """
+
+    __slots__ = ()
+
+
+def _mark_safe(value: str) -> str:
+    """Return value as SafeStr unless it still looks sensitive to the log filter."""
+    if SensitiveDataFilter.ANY_SENSITIVE_PATTERN.search(value):
+        return value
+    return SafeStr(value)
+
 
 def sanitize_jql_value(value: str, value_type: str = 'key') -> str:
     """Validate and sanitize JQL input to prevent injection attacks.
@@ -37,6 +65,15 @@ def sanitize_jql_value(value: str, value_type: str = 'key') -> str:
     if not value or not isinstance(value, str):
         raise ValueError(f"Value must be a non-empty string, got: {type(value)}")
 
+    return _sanitize_jql_value(value, value_type)
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_jql_value(value: str, value_type: str) -> str:
+    """Validate a string value; cached because the same keys/labels recur across JQL builds.
+
+    Only successful results are cached: a rejected value raises again on every call.
+    """
     value = value.strip()
 
     if not value:
@@ -53,39 +90,29 @@ def sanitize_jql_value(value: str, value_type: str = 'key') -> str:
     # Validate based on value type
     if value_type == 'key':
         # Jira issue keys: PROJECT-123
-        pattern = r'^[A-Z][A-Z0-9]*-\d+$'
-        if not re.match(pattern, value):
+        if not _ISSUE_KEY_RE.match(value):
             raise ValueError(
                 f"Invalid issue key format: '{value}'. "
                 f"Expected format: UPPERCASE-NUMBER (e.g., PROJ-123)"
             )
-        return value
+        return _mark_safe(value)
 
     elif value_type == 'label':
-        # Labels: alphanumeric, hyphen, underscore, ampersand (for S&A_MGT, S&A-MPC)
-        pattern = r'^[a-zA-Z0-9\-_&]+$'
-        if not re.match(pattern, value):
+        if not _LABEL_RE.match(value):
             raise ValueError(
                 f"Invalid label format: '{value}'. "
                 f"Labels can only contain letters, numbers, hyphens, underscores, and ampersands"
             )
-        return value
+        return _mark_safe(value)
 
     elif value_type == 'text':
         # Free-form text: block special JQL operators and dangerous chars
-        dangerous_patterns = [
-            r'\bAND\b', r'\bOR\b', r'\bNOT\b', r'\bIN\b', r'\bIS\b',
-            r'\bWAS\b', r'\bWAS\s+IN\b', r'\bIS\s+NOT\b',
-            r'[<>=!~]', r'[()]', r'[\[\]]'
-        ]
-        for pattern in dangerous_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise ValueError(
-                    f"Invalid text value '{value}': contains JQL operator or special character"
-                )
+        if _JQL_TEXT_DANGER_RE.search(value):
+            raise ValueError(
+                f"Invalid text value '{value}': contains JQL operator or special character"
+            )
         # Escape quotes
-        value = value.replace('"', '\\"').replace("'", "\\'")
-        return value
+        return _mark_safe(value.translate(_QUOTE_ESCAPE))
 
     else:
         raise ValueError(f"Unknown value_type: '{value_type}'. Use 'key', 'label', or 'text'")
@@ -114,15 +141,11 @@ def sanitize_jql_list(values: List[str], value_type: str = 'key') -> List[str]:
     if not values:
         return []
 
-    sanitized = []
-    for value in values:
-        try:
-            sanitized.append(sanitize_jql_value(value, value_type))
-        except ValueError as e:
-            # Re-raise with context about which value failed
-            raise ValueError(f"Failed to sanitize value in list: {e}") from e
-
-    return sanitized
+    try:
+        return [sanitize_jql_value(value, value_type) for value in values]
+    except ValueError as e:
+        # Re-raise with context about which value failed
+        raise ValueError(f"Failed to sanitize value in list: {e}") from e
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -144,6 +167,14 @@ class SensitiveDataFilter(logging.Filter):
     EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
     LONG_ALPHANUM_PATTERN = re.compile(r'\b[a-zA-Z0-9]{24,}\b')
 
+    # Matches wherever any of the three patterns does: one scan tells whether a
+    # message needs redacting at all (most log messages don't)
+    ANY_SENSITIVE_PATTERN = re.compile(
+        '|'.join(p.pattern for p in (API_TOKEN_PATTERN, EMAIL_PATTERN, LONG_ALPHANUM_PATTERN))
+    )
+    # Shortest text any pattern can match: 'ATATTx' or 'a@b.cc'
+    MIN_SENSITIVE_LEN = 6
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Redact sensitive data from the log record.
 
@@ -165,10 +196,15 @@ class SensitiveDataFilter(logging.Filter):
                     for k, v in record.args.items()
                 }
             elif isinstance(record.args, tuple):
-                record.args = tuple(
-                    self._redact(arg) if isinstance(arg, str) else arg
-                    for arg in record.args
-                )
+                # _redact returns clean strings as-is; only build a new tuple once one changes
+                args = record.args
+                for i, arg in enumerate(args):
+                    if isinstance(arg, str) and self._redact(arg) is not arg:
+                        record.args = args[:i] + tuple(
+                            self._redact(a) if isinstance(a, str) else a
+                            for a in args[i:]
+                        )
+                        break
 
         return True
 
@@ -181,27 +217,26 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             Text with sensitive data replaced
         """
-        if not isinstance(text, str):
+        # SafeStr values were already checked when sanitize_jql_value produced them
+        if (not isinstance(text, str) or isinstance(text, SafeStr)
+                or len(text) < self.MIN_SENSITIVE_LEN
+                or not self.ANY_SENSITIVE_PATTERN.search(text)):
             return text
 
-        # Redact API tokens
+        # The passes run in sequence on purpose: redacting a token first can expose an
+        # adjacent email address to the next pass, which a single fused pass would miss
         text = self.API_TOKEN_PATTERN.sub('[REDACTED-TOKEN]', text)
-
-        # Redact email addresses
         text = self.EMAIL_PATTERN.sub('[REDACTED-EMAIL]', text)
+        # Long alphanumeric runs (potential credentials); they contain no hyphen,
+        # so issue keys (PROJ-123) are never matched
+        return self.LONG_ALPHANUM_PATTERN.sub('[REDACTED]', text)
 
-        # Redact long alphanumeric strings (potential credentials/tokens)
-        # But preserve issue keys (format: PROJ-123)
-        def replace_if_not_issue_key(match):
-            value = match.group(0)
-            # Don't redact if it looks like an issue key
-            if re.match(r'^[A-Z]+-\d+$', value):
-                return value
-            return '[REDACTED]'
 
-        text = self.LONG_ALPHANUM_PATTERN.sub(replace_if_not_issue_key, text)
+# The filter keeps no per-logger state, so every safe logger shares one instance
+_SHARED_FILTER = SensitiveDataFilter()
 
-        return text
+# Loggers get_safe_jql_logger already attached the shared filter to
+_FILTERED_LOGGERS = weakref.WeakSet()
 
 
 def get_safe_jql_logger(name: str) -> logging.Logger:
@@ -222,9 +257,9 @@ def get_safe_jql_logger(name: str) -> logging.Logger:
     """
     logger = logging.getLogger(name)
 
-    # Check if filter already added (avoid duplicates)
-    has_filter = any(isinstance(f, SensitiveDataFilter) for f in logger.filters)
-    if not has_filter:
-        logger.addFilter(SensitiveDataFilter())
+    # Only add the filter once per logger (avoid duplicates)
+    if logger not in _FILTERED_LOGGERS:
+        logger.addFilter(_SHARED_FILTER)
+        _FILTERED_LOGGERS.add(logger)
 
     return logger
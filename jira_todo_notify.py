@@ -12,6 +12,7 @@ from pathlib import Path
 import requests
 
 from jira_config import load_jira_env, get_ssl_verify, get_jira_session
+from jira_performance import decode_json_response
 
 JIRA_ENV = load_jira_env()
 JIRA_URL = JIRA_ENV.get("JT_JIRA_URL", "https://equinixjira.atlassian.net/").rstrip("/")
@@ -60,7 +61,7 @@ def get_todo_stories():
         params = {"startAt": start_at, "maxResults": 50}
         resp = _JIRA_SESSION.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = decode_json_response(resp)
         issues.extend(data["issues"])
         if start_at + 50 >= data["total"]:
             break
@@ -89,11 +90,23 @@ def group_by_assignee(issues):
     return grouped
 
 # --- Send notification emails ---
-def send_email(to_email, to_name, issues, method="smtp", platform=None):
+def send_email(to_email, to_name, issues, method="smtp", platform=None, bcc=None):
+    """Send the 'To Do' reminder for ``issues`` to ``to_email``.
+
+    When ``bcc`` is given (SMTP only), the same message is delivered to every
+    address in it with a single ``sendmail`` call; the addresses only appear in
+    the SMTP envelope, not in the message headers.
+    """
     from_email = SMTP["FROM_EMAIL"]
     from_name = SMTP["FROM_NAME"]
     subject = f"Jira: Your 'To Do' Stories"
 
+    # Extract (key, summary, url) once; both bodies are rendered from these rows
+    rows = [
+        (issue["key"], issue["fields"].get("summary", ""), f"{JIRA_URL}/browse/{issue['key']}")
+        for issue in issues
+    ]
+
     # Build HTML body
     html_body = f"""
     <html>
@@ -103,11 +116,7 @@ def send_email(to_email, to_name, issues, method="smtp", platform=None):
     Please see to it they get updated. Once done, set them to the <b>To Refine</b> state so we can refine the story further.</p><br>
     <ul>
     """
-    for issue in issues:
-        key = issue["key"]
-        summary = issue["fields"].get("summary", "")
-        url = f"{JIRA_URL}/browse/{key}"
-        html_body += f'<li><a href="{url}"><b>{key}</b></a>: {summary}</li>'
+    html_body += "".join(f'<li><a href="{url}"><b>{key}</b></a>: {summary}</li>' for key, summary, url in rows)
     html_body += """
     </ul>
     <p>With kind regards,<br>Your Product Owner</p>
@@ -124,15 +133,12 @@ def send_email(to_email, to_name, issues, method="smtp", platform=None):
         f"You have the following story/stories in the 'To Do' state:{PS}"
         f"--------------------------------------------------------{PS}"
     )
-    for issue in issues:
-        key = issue["key"]
-        summary = issue["fields"].get("summary", "")
-        url = f"{JIRA_URL}/browse/{key}"
-        body += (
-            f"{key}:{LS}"
-            f"    {summary}{LS}"
-            f"    Link: {url}{PS}"
-        )
+    body += "".join(
+        f"{key}:{LS}"
+        f"    {summary}{LS}"
+        f"    Link: {url}{PS}"
+        for key, summary, url in rows
+    )
     body += (
         f"--------------------------------------------------------{PS}"
         f"Please update these stories as needed. Once done, set them to the 'To Refine' state so we can refine them further.{PS}"
@@ -148,7 +154,11 @@ def send_email(to_email, to_name, issues, method="smtp", platform=None):
         part2 = MIMEText(html_body, "html")
         msg.attach(part1)
         msg.attach(part2)
-        print(f"[LOG] Sending email to {to_email} using SMTP with HTML and plain text parts.")
+        recipients = list(bcc) if bcc else [to_email]
+        if bcc:
+            print(f"[LOG] Sending one email to {len(recipients)} recipients (BCC) using SMTP with HTML and plain text parts.")
+        else:
+            print(f"[LOG] Sending email to {to_email} using SMTP with HTML and plain text parts.")
         try:
             smtp_server = SMTP["SMTP_SERVER"]
             smtp_port = int(SMTP["SMTP_PORT"])
@@ -157,7 +167,7 @@ def send_email(to_email, to_name, issues, method="smtp", platform=None):
                 with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
                     if SMTP["SMTP_USER"] and SMTP["SMTP_PASSWORD"]:
                         server.login(SMTP["SMTP_USER"], SMTP["SMTP_PASSWORD"])
-                    server.sendmail(from_email, [to_email], msg.as_string())
+                    server.sendmail(from_email, recipients, msg.as_string())
             else:
                 import smtplib
                 with smtplib.SMTP(smtp_server, smtp_port) as server:
@@ -167,8 +177,11 @@ def send_email(to_email, to_name, issues, method="smtp", platform=None):
                         server.ehlo()
                     if SMTP["SMTP_USER"] and SMTP["SMTP_PASSWORD"]:
                         server.login(SMTP["SMTP_USER"], SMTP["SMTP_PASSWORD"])
-                    server.sendmail(from_email, [to_email], msg.as_string())
-            print(f"Email sent to {to_email}")
+                    server.sendmail(from_email, recipients, msg.as_string())
+            if bcc:
+                print(f"Email sent to {len(recipients)} recipients (BCC)")
+            else:
+                print(f"Email sent to {to_email}")
         except Exception as e:
             print(f"Failed to send email to {to_email}: {e}")
     elif method == "outlook":
@@ -214,6 +227,7 @@ if __name__ == "__main__":
     parser.add_argument('--test-email', type=str, help='Override the test email address (overrides smtp_settings.env)')
     parser.add_argument('--email-method', choices=['smtp', 'outlook'], help='Choose email method: smtp or outlook (overrides smtp_settings.env)')
     parser.add_argument('--outlook-platform', choices=['mac', 'windows'], help='If using --email-method outlook, specify platform (overrides smtp_settings.env)')
+    parser.add_argument('--bulk-bcc', action='store_true', help='Send one generic reminder listing all stories to every assignee via BCC (SMTP only)')
     args = parser.parse_args()
 
     # Use CLI args if provided, else fall back to smtp_settings.env
@@ -240,6 +254,16 @@ if __name__ == "__main__":
         if confirm != 'yes':
             print("Aborted by user.")
             sys.exit(0)
+        if args.bulk_bcc and email_method == "smtp":
+            # One message body for everyone: the sender is the visible recipient, assignees are BCC'd
+            all_issues = [issue for user_issues in grouped.values() for issue in user_issues]
+            if all_issues:
+                send_email(SMTP["FROM_EMAIL"], "team", all_issues, method=email_method, bcc=list(grouped.keys()))
+            else:
+                print("No 'To Do' stories found.")
+            sys.exit(0)
+        if args.bulk_bcc:
+            print("--bulk-bcc is only supported with the SMTP method; sending individual emails instead.")
         for email, user_issues in grouped.items():
             # If this is the fallback group, use a generic name
             if email == "bas.rutjes@eu.equinix.com":
@@ -1,5 +1,6 @@
 import sys
 import time
+from functools import lru_cache
 """
 Jira Sprint PowerPoint Generator
 --------------------------------
@@ -9,26 +10,31 @@ All text is placed using template placeholders for consistent formatting.
 Split: presentation logic moved to jpt_presentation.py
 """
 
-def get_upcoming_sprint_id():
-    url = f"{JIRA_URL}/rest/agile/1.0/board/{BOARD_ID}/sprint?state=future"
-    resp = _JIRA_SESSION.get(url, timeout=15)
-    resp.raise_for_status()
-    sprints = resp.json().get("values", [])
-    if not sprints:
-        return None
-    return sprints[0]["id"]
 import requests
-from jpt_presentation import create_presentation
-from collections import defaultdict
+from jpt_presentation import create_presentation, detect_epic_name
+from collections import ChainMap, defaultdict
 import os
+import re
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Load Jira credentials from .jira_environment
 from jira_config import load_jira_env, get_ssl_verify, get_jira_session
 from jira_metrics import build_velocity_history
 from jira_security import sanitize_jql_value, sanitize_jql_list, get_safe_jql_logger
-from jira_performance import parse_iso8601_datetime, get_cached_sprint_metadata
-from jira_async import fetch_epics_sync
+from jira_performance import (
+    parse_iso8601_datetime,
+    get_cached_sprint_metadata,
+    clear_sprint_cache,
+    cached_get_json,
+    decode_json_response,
+    enable_response_cache,
+    EPIC_PARENT_CACHE_TTL,
+    SPRINT_LIST_CACHE_TTL,
+    load_cached_entries,
+    store_cached_entries,
+)
 from datetime import datetime
 
 JIRA_ENV = load_jira_env()
@@ -39,6 +45,72 @@ BOARD_ID = JIRA_ENV.get("JT_JIRA_BOARD")
 FIELD_STORY_POINTS = JIRA_ENV.get("JT_JIRA_FIELD_STORY_POINTS", "customfield_10024")
 SSL_VERIFY = get_ssl_verify()
 
+# Pagination settings for sprint issue fetching (pages after the first are fetched concurrently).
+# Jira may cap maxResults lower (e.g. with expand=changelog); get_issues follows the size it returns.
+ISSUE_PAGE_SIZE = 500
+ISSUE_FETCH_WORKERS = 8
+# Concurrent 'key in (...)' JQL searches for epic parents/initiatives (override with JT_JQL_SEARCH_WORKERS)
+DEFAULT_JQL_SEARCH_WORKERS = 5
+
+
+def _jql_search_workers():
+    try:
+        return max(1, int(os.environ.get("JT_JQL_SEARCH_WORKERS", DEFAULT_JQL_SEARCH_WORKERS)))
+    except ValueError:
+        return DEFAULT_JQL_SEARCH_WORKERS
+
+
+JQL_SEARCH_WORKERS = _jql_search_workers()
+# Seconds to wait for the background next-sprint/velocity fetches once the slides need them;
+# on timeout those slides are built (and the deck saved) without that data. A fetch already
+# running is not interrupted: jpt still waits for it before returning (see main()).
+BACKGROUND_FETCH_TIMEOUT = 60
+
+# Fields read from current-sprint issues: grouping, slide text, mid-sprint detection,
+# sprint membership (issue_in_sprint) and epic detection (detect_epic_name).
+SPRINT_ISSUE_FIELDS = (
+    "summary", "status", "issuetype", "labels", "assignee", "created", "parent",
+    "epic", "sprint", "closedSprints",
+    "customfield_10006", "customfield_10007", "customfield_10008", "customfield_10020", "customfield_10100",
+)
+
+# Label -> slide group title, in slide order (matched case-insensitively)
+LABEL_MAP = {
+    "nlms": "Dutch Platform(s)",
+    "iems": "Irish Platform(s)",
+    "esms": "Spanish Platform(s)",
+    "ukms": "UK Platform(s)",
+    "s&a-mpc": "MPC",
+    "s&a_mgt": "Management tasks",
+    "fims": "Finnish Platform(s)",
+}
+LABEL_ORDER = tuple(LABEL_MAP)
+LABEL_SET = frozenset(LABEL_MAP)
+LABEL_PRIORITY = {label: i for i, label in enumerate(LABEL_ORDER)}
+
+# Only stories and tasks are planned from the next sprint; filtered by Jira
+NEXT_SPRINT_JQL = "issuetype in (Story, Task)"
+
+# Status / issue type classification (all lower-case)
+DONE_STATUSES = frozenset(("done", "closed", "resolved"))
+CANCELLED_STATUSES = frozenset(("cancelled", "canceled", "removed", "declined"))
+PLANNABLE_ISSUE_TYPES = frozenset(("story", "task"))
+
+# Output filename sanitizing: anything not valid in filenames (non-ASCII, special chars) -> underscore
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\-.]', re.ASCII)
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Issue keys (e.g. "PROJ-123") and EMSS initiative keys referenced from epics
+_ISSUE_KEY_RE = re.compile(r'^[A-Z]+-\d+$')
+_EMSS_TOKEN_RE = re.compile(r"\bEMSS-\d+\b")
+
+# Fields never used as a fallback description for a parent issue
+_DESCRIPTION_SKIP_FIELDS = frozenset(("summary", "issuetype", "status", "priority"))
+
+# Progress indicator: each milestone shows the next clock face
+PROGRESS_EMOJIS = ("⏳", "🕐", "🕑", "🕒", "🕓", "🕔")
+_progress_emojis = itertools.cycle(PROGRESS_EMOJIS)
+
 # Shared session for all Jira API calls (with retry logic, auth, SSL)
 _JIRA_SESSION = get_jira_session()
 
@@ -52,23 +124,15 @@ else:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     logger.setLevel(logging.INFO)
 
-# DEPRECATED: Use _JIRA_SESSION.get() instead
-def jira_get(url, params=None, max_retries=4, backoff=1.0, timeout=15, **kwargs):
-    """DEPRECATED: Use get_jira_session().get() or _JIRA_SESSION.get() instead.
+def show_progress(message, emoji=None):
+    """Redraw the progress line in place; called at each milestone (no spinner thread)."""
+    sys.stdout.write(f"\r{emoji or next(_progress_emojis)} {message:<60}")
+    sys.stdout.flush()
 
-    This function is kept temporarily for backward compatibility.
-    Will be removed in a future version.
 
-    The shared session (_JIRA_SESSION) now handles retry logic automatically.
-    """
-    import warnings
-    warnings.warn(
-        "jira_get() is deprecated. Use get_jira_session().get() instead.",
-        DeprecationWarning,
-        stacklevel=2
-    )
-    # Delegate to shared session
-    return _JIRA_SESSION.get(url, params=params, timeout=timeout, **kwargs)
+# Index of the payload shape each search endpoint last answered 200 to; Jira instances
+# accept different shapes, so later searches start with the one that worked
+_JQL_SHAPE_BY_ENDPOINT = {}
 
 
 def jql_search(payload, max_retries=2):
@@ -76,6 +140,8 @@ def jql_search(payload, max_retries=2):
 
     Returns the parsed JSON on success, or None on failure.
 
+    Endpoints and payload shapes that succeeded before are tried first.
+
     Note: Now uses shared session with automatic retry logic.
     """
     headers = {"Content-Type": "application/json", "Accept": "application/json"}
@@ -83,6 +149,8 @@ def jql_search(payload, max_retries=2):
         f"{JIRA_URL}/rest/api/3/search/jql",
         f"{JIRA_URL}/rest/api/3/search",
     ]
+    # Stable sort: an endpoint that has worked before moves to the front
+    endpoints.sort(key=lambda e: e not in _JQL_SHAPE_BY_ENDPOINT)
     # Try a few payload shapes because different Jira Cloud instances accept slightly different shapes
     jql = payload.get("jql") or payload.get("query") or ''
     field_list = payload.get("fields")
@@ -95,25 +163,29 @@ def jql_search(payload, max_retries=2):
         {"jql": jql},
     ]
     for endpoint in endpoints:
+        first_shape = _JQL_SHAPE_BY_ENDPOINT.get(endpoint, 0)
+        shapes = list(range(first_shape, len(candidate_payloads))) + list(range(first_shape))
         for attempt in range(1, max_retries + 1):
-            for try_payload in candidate_payloads:
+            for shape in shapes:
+                try_payload = candidate_payloads[shape]
                 try:
                     logger.debug("POST %s payload=%s (attempt %d)", endpoint, try_payload, attempt)
                     resp = _JIRA_SESSION.post(endpoint, json=try_payload, headers=headers, timeout=15)
-                    text = None
-                    try:
-                        text = resp.text
-                    except Exception:
-                        text = '<no-body>'
-                    logger.debug("Response %s %s", resp.status_code, (text[:200] + '...') if text and len(text) > 200 else text)
+                    debug = logger.isEnabledFor(logging.DEBUG)
+                    if debug:
+                        # Slice the raw bytes: only the logged part is decoded, and only at DEBUG
+                        body = resp.content or b''
+                        logger.debug("Response %s %s%s", resp.status_code, body[:200].decode('utf-8', 'replace'), '...' if len(body) > 200 else '')
                     if resp.status_code == 200:
+                        _JQL_SHAPE_BY_ENDPOINT[endpoint] = shape
                         try:
-                            return resp.json()
+                            return decode_json_response(resp)
                         except Exception:
                             return None
                     # client error: try next payload shape immediately
                     if 400 <= resp.status_code < 500:
-                        logger.debug("Client error %s from %s for payload %s: %s", resp.status_code, endpoint, try_payload, text)
+                        if debug:
+                            logger.debug("Client error %s from %s for payload %s: %s", resp.status_code, endpoint, try_payload, (resp.content or b'')[:500].decode('utf-8', 'replace'))
                         continue
                     # server error: wait and retry payload/endpoint
                     time.sleep(0.5 * attempt)
@@ -124,40 +196,171 @@ def jql_search(payload, max_retries=2):
     logger.warning("JQL search failed for payload: %s", payload)
     return None
 
+
+@lru_cache(maxsize=256)
+def _jql_search_cached(jql, fields, max_results):
+    """Memoized jql_search for repeated lookups within a run; ``fields`` must be a tuple.
+
+    Raises RuntimeError instead of returning None so failed searches are not cached.
+    """
+    data = jql_search({"jql": jql, "fields": list(fields), "maxResults": max_results})
+    if data is None:
+        raise RuntimeError(f"JQL search failed: {jql}")
+    return data
+
+
+def search_issues_by_key(keys, fields, chunk_size=50):
+    """Fetch issues by key with one 'key in (...)' JQL search per chunk of keys.
+
+    The searches run concurrently (JQL_SEARCH_WORKERS at a time). Returns a list of
+    (chunk, data) pairs in chunk order, where data is None if that search failed.
+    """
+    key_chunks = [keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size)]
+    if not key_chunks:
+        return []
+
+    def search_chunk(chunk):
+        # Sanitize keys to prevent JQL injection
+        sanitized = sanitize_jql_list(chunk, value_type='key')
+        try:
+            return _jql_search_cached(f"key in ({','.join(sanitized)})", tuple(fields), 100)
+        except Exception:
+            logger.debug("JQL key search failed for %s", chunk, exc_info=True)
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(JQL_SEARCH_WORKERS, len(key_chunks))) as pool:
+        return list(zip(key_chunks, pool.map(search_chunk, key_chunks)))
+
+
+def find_linked_parent(epic_key):
+    """Return the key of an issue linked to ``epic_key`` to use as its parent, or None.
+
+    Prefers an Initiative in the EMSS project; otherwise takes the first linked issue
+    in any project.
+    """
+    # Sanitize epic key to prevent JQL injection
+    ek_sanitized = sanitize_jql_value(epic_key, value_type='key')
+    for jql in (
+        f'project = EMSS AND issue in linkedIssues("{ek_sanitized}") AND issuetype = Initiative',
+        f'issue in linkedIssues("{ek_sanitized}")',
+    ):
+        try:
+            data = _jql_search_cached(jql, ("summary",), 5)
+        except Exception:
+            continue
+        linked = (data or {}).get('issues', [])
+        if linked:
+            return linked[0].get('key')
+    return None
+
+
+def _extract_description_from_fields(field_dict, prefer_summary=""):
+    """Return the description of an issue's fields, or the first long text field.
+
+    ``prefer_summary`` is the stripped summary; a text field equal to it is skipped.
+    """
+    d = field_dict.get('description')
+    if d:
+        return d
+    # look for long string fields that look like descriptions
+    for kk, vv in field_dict.items():
+        if kk in _DESCRIPTION_SKIP_FIELDS:
+            continue
+        if isinstance(vv, str):
+            if _is_long_text(vv) and not _matches_summary(vv, prefer_summary):
+                return vv
+        elif isinstance(vv, dict):
+            value = vv.get('value')
+            if isinstance(value, str) and _is_long_text(value):
+                return value
+    return ""
+
+
+def _is_long_text(text):
+    """Return True if text is longer than 40 characters once stripped (copies only when padded)."""
+    if len(text) <= 40:
+        return False
+    if not text[0].isspace() and not text[-1].isspace():
+        return True
+    return len(text.strip()) > 40
+
+
+def _matches_summary(text, stripped_summary):
+    """Return True if text equals the (already stripped) summary, ignoring surrounding whitespace."""
+    return bool(stripped_summary) and len(text) >= len(stripped_summary) and text.strip() == stripped_summary
+
+
+def _parent_info(pkey, psummary, pdesc_raw):
+    """Return the initiative info dict (key, display, description) shown for a parent issue.
+
+    The display is "KEY: summary — excerpt", where the excerpt is the description's
+    first line cut to 120 characters, to keep slides tidy.
+    """
+    display = f"{pkey}: {psummary}" if psummary else pkey
+    if pdesc_raw:
+        excerpt = str(pdesc_raw)[:120]
+        if not isinstance(pdesc_raw, dict):
+            # first line only: cutting first means only 120 characters are ever scanned
+            excerpt = excerpt.partition('\n')[0].rstrip('\r')
+        if excerpt:
+            display = f"{display} — {excerpt}"
+    return {"key": pkey, "display": display, "description": pdesc_raw}
+
+
+@lru_cache(maxsize=1)
 def get_current_sprint_id():
     """
     Get the ID of the current active sprint from Jira.
+
+    Cached for the lifetime of the process; the active sprint does not change during a run.
+    The sprint list itself is also kept in the on-disk cache (when enabled) for 10 minutes.
     """
     url = f"{JIRA_URL}/rest/agile/1.0/board/{BOARD_ID}/sprint?state=active"
-    resp = _JIRA_SESSION.get(url, timeout=15)
-    resp.raise_for_status()
-    sprints = resp.json().get("values", [])
+    sprints = cached_get_json(_JIRA_SESSION, url, ttl=SPRINT_LIST_CACHE_TTL).get("values", [])
     if not sprints:
         raise Exception("No active sprint found.")
     return sprints[0]["id"]
 
-def get_issues(sprint_id, expand_changelog=False):
+def get_issues(sprint_id, expand_changelog=False, fields=None, jql=None):
     """
     Fetch all issues for a given sprint ID from Jira.
     Returns a list of issue dicts.
 
     If expand_changelog is True, includes changelog data for each issue
     (needed for detecting when issues were added to the sprint).
+    If fields is given (iterable of field ids), only those fields are requested.
+    If jql is given, Jira filters the sprint's issues server-side.
+
+    The first page is fetched synchronously to learn the total; the remaining
+    pages are then fetched concurrently over the shared session.
     """
     url = f"{JIRA_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
-    issues = []
-    start_at = 0
-    while True:
-        params = {"startAt": start_at, "maxResults": 50}
-        if expand_changelog:
-            params["expand"] = "changelog"
-        resp = _JIRA_SESSION.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        issues.extend(data["issues"])
-        if start_at + 50 >= data["total"]:
-            break
-        start_at += 50
+    base_params = {"maxResults": ISSUE_PAGE_SIZE}
+    if expand_changelog:
+        base_params["expand"] = "changelog"
+    if fields:
+        base_params["fields"] = ",".join(fields)
+    if jql:
+        base_params["jql"] = jql
+
+    def fetch_page(start_at):
+        # Served from the on-disk cache when enabled (CLI runs without --no-cache)
+        return cached_get_json(_JIRA_SESSION, url, params={**base_params, "startAt": start_at})
+
+    first = fetch_page(0)
+    issues = list(first["issues"])
+    total = first["total"]
+    # Jira may cap maxResults below what we asked for; step by the page size it actually returned
+    page_size = len(issues)
+    if not page_size or page_size >= total:
+        return issues
+    if page_size < ISSUE_PAGE_SIZE:
+        logger.debug("Jira capped sprint issue pages at %d (asked for %d)", page_size, ISSUE_PAGE_SIZE)
+    offsets = range(page_size, total, page_size)
+    with ThreadPoolExecutor(max_workers=min(ISSUE_FETCH_WORKERS, len(offsets))) as pool:
+        # map() keeps pages in startAt order so the result matches a sequential fetch
+        for data in pool.map(fetch_page, offsets):
+            issues.extend(data["issues"])
     return issues
 
 def get_sprint_name(sprint_id):
@@ -222,33 +425,38 @@ def parse_issue_sprint_added_date(issue, sprint_id, sprint_name=None):
     Returns a datetime object or None if not found.
 
     The function looks for changes to the 'Sprint' field where the sprint was added.
+    Histories are scanned newest-first (Jira returns them oldest-first), so the most
+    recent addition wins and the scan stops at the first match.
     """
-    changelog = issue.get('changelog', {})
-    histories = changelog.get('histories', [])
-
+    histories = (issue.get('changelog') or {}).get('histories')
     if not histories:
         return None
 
     sprint_id_str = str(sprint_id)
 
-    for history in histories:
+    for history in reversed(histories):
         created = history.get('created')
-        items = history.get('items', [])
-
-        for item in items:
+        if not created:
+            continue
+        for item in history.get('items', ()):
             # Look for Sprint field changes
-            if item.get('field', '').lower() == 'sprint':
+            if (item.get('field') or '').lower() != 'sprint':
+                continue
+            # 'to'/'from' hold comma-separated sprint ids; only count changes that add our sprint
+            to_ids = [sid.strip() for sid in (item.get('to') or '').split(',')]
+            if any(to_ids):
+                from_ids = [sid.strip() for sid in (item.get('from') or '').split(',')]
+                added = sprint_id_str in to_ids and sprint_id_str not in from_ids
+            else:
+                # No ids recorded: fall back to matching the display string ("Sprint 42")
                 to_string = item.get('toString') or ''
-
-                # Check if this change added the issue to our sprint
-                # toString might be something like "Sprint 42" or contain the sprint name/id
-                if sprint_id_str in to_string or (sprint_name and sprint_name in to_string):
-                    if created:
-                        # Use optimized cached date parser
-                        dt = parse_iso8601_datetime(created)
-                        if dt:
-                            return dt
-                        continue
+                added = sprint_id_str in to_string or bool(sprint_name and sprint_name in to_string)
+            if added:
+                # Use optimized cached date parser
+                dt = parse_iso8601_datetime(created)
+                if dt:
+                    return dt
+                break
 
     return None
 
@@ -308,17 +516,37 @@ def mark_mid_sprint_additions(issues, sprint_id, sprint_name=None):
     return sprint_start
 
 
+@lru_cache(maxsize=1)
 def get_next_sprint_id():
-    """Return the first future sprint id on the board, or None if none planned."""
+    """Return the first future sprint id on the board, or None if none planned (cached per process)."""
     url = f"{JIRA_URL}/rest/agile/1.0/board/{BOARD_ID}/sprint?state=future"
-    resp = _JIRA_SESSION.get(url, timeout=15)
-    resp.raise_for_status()
-    sprints = resp.json().get("values", [])
+    sprints = cached_get_json(_JIRA_SESSION, url, ttl=SPRINT_LIST_CACHE_TTL).get("values", [])
     if not sprints:
         return None
     return sprints[0].get("id")
 
 
+# Same endpoint as get_next_sprint_id: keep one implementation and one cache entry
+get_upcoming_sprint_id = get_next_sprint_id
+
+
+def clear_cache():
+    """Forget the lookups cached in this process (sprint ids, sprint metadata, JQL searches).
+
+    The on-disk response cache is separate; see jira_performance.clear_response_cache().
+    """
+    get_current_sprint_id.cache_clear()
+    get_next_sprint_id.cache_clear()
+    _jql_search_cached.cache_clear()
+    clear_sprint_cache()
+
+
+def get_next_sprint_issues():
+    """Return the stories and tasks of the next planned sprint, or an empty list when none is planned."""
+    next_id = get_next_sprint_id()
+    return get_issues(next_id, fields=SPRINT_ISSUE_FIELDS, jql=NEXT_SPRINT_JQL) if next_id else []
+
+
 def issue_in_sprint(issue, sprint_id):
     """Return True if the given issue is part of the sprint with id sprint_id.
 
@@ -363,19 +591,8 @@ def group_issues_by_label(issues, sprint_id=None):
     Only includes issues of type 'story' or 'task'.
     Returns a dict: label -> list of issues, in the order of the label list, with 'Other' for unmatched.
     """
-    LABEL_MAP = {
-        "nlms": "Dutch Platform(s)",
-        "iems": "Irish Platform(s)",
-        "esms": "Spanish Platform(s)",
-        "ukms": "UK Platform(s)",
-        "s&a-mpc": "MPC",
-        "s&a_mgt": "Management tasks",
-        "fims": "Finnish Platform(s)",
-    }
-    LABEL_ORDER = list(LABEL_MAP.keys())
     grouped = {LABEL_MAP[label]: [] for label in LABEL_ORDER}
     grouped["Other"] = []
-    CANCELLED_STATUSES = {"cancelled", "canceled", "removed", "declined"}
     for issue in issues:
         # If a sprint_id is provided, filter out issues that are not part of that sprint.
         if sprint_id is not None and not issue_in_sprint(issue, sprint_id):
@@ -393,16 +610,14 @@ def group_issues_by_label(issues, sprint_id=None):
                 pass
             continue
         issuetype = fields["issuetype"]["name"].lower()
-        if issuetype not in ["story", "task"]:
+        if issuetype not in PLANNABLE_ISSUE_TYPES:
             continue
-        labels = [l.lower() for l in fields.get("labels", [])]
-        found = False
-        for label_key in LABEL_ORDER:
-            if label_key in labels:
-                grouped[LABEL_MAP[label_key]].append(issue)
-                found = True
-                break
-        if not found:
+        matched = LABEL_SET.intersection(l.lower() for l in fields.get("labels", ()))
+        if matched:
+            # Several known labels: the first one in slide order wins
+            label_key = min(matched, key=LABEL_PRIORITY.__getitem__)
+            grouped[LABEL_MAP[label_key]].append(issue)
+        else:
             grouped["Other"].append(issue)
     # Remove empty groups for cleaner output
     return {k: v for k, v in grouped.items() if v}
@@ -417,103 +632,73 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Jira Presentation Tool")
     parser.add_argument("--dump-issue", "-d", nargs="+", help="Issue key(s) to fetch and print full JSON (fields=*all) and exit")
     parser.add_argument("--dump-epic-map", action="store_true", help="Print the built epic->initiative mapping (includes captured descriptions) before creating the presentation")
+    parser.add_argument("--no-cache", "--refresh", action="store_true", help="Always fetch fresh sprint data instead of reusing responses cached in .jpt_cache (10 min for sprint lists, 15 min for sprint issues; 24 h for closed sprints)")
     args, unknown = parser.parse_known_args()
     if args.dump_issue:
         for ik in args.dump_issue:
-            try:
-                spinner_running = False
-            except Exception:
-                pass
             url = f"{JIRA_URL}/rest/api/2/issue/{ik}"
             params = {"fields": "*all", "expand": "names,renderedFields"}
             try:
                 resp = _JIRA_SESSION.get(url, params=params, timeout=15)
                 resp.raise_for_status()
-                data = resp.json()
+                data = decode_json_response(resp)
                 print(json.dumps(data, indent=2, ensure_ascii=False))
             except Exception as e:
                 print(f"Failed to fetch {ik}: {e}")
         sys.exit(0)
 
-    # Emoji spinner for progress indicator
-    import threading
-    import itertools
-    import time
-
-    spinner_running = True
-    spinner_message = ["Starting..."]
-    def spinner_func():
-        emojis = ["⏳", "🕐", "🕑", "🕒", "🕓", "🕔", "⌛", "🕐", "🕑", "🕒", "🕓", "🕔"]
-        for idx in itertools.cycle(range(len(emojis))):
-            if not spinner_running:
-                break
-            sys.stdout.write(f"\r{emojis[idx]} {spinner_message[0]}   ")
-            sys.stdout.flush()
-            time.sleep(0.15)
-        sys.stdout.write("\r" + " " * 40 + "\r")
-
-    spinner_thread = threading.Thread(target=spinner_func)
-    spinner_thread.start()
+    if not args.no_cache:
+        enable_response_cache()
+
+    # Next-sprint issues and velocity history don't depend on the current sprint:
+    # fetch them in the background while the current sprint is processed
+    background = ThreadPoolExecutor(max_workers=2)
+    next_sprint_future = background.submit(get_next_sprint_issues)
+    velocity_future = background.submit(
+        build_velocity_history,
+        JIRA_URL,
+        BOARD_ID,
+        (JIRA_EMAIL, JIRA_API_TOKEN),
+        FIELD_STORY_POINTS,
+        max_sprints=10,
+    )
 
     try:
-        spinner_message[0] = "Fetching current sprint ID..."
+        show_progress("Fetching current sprint ID...")
         sprint_id = get_current_sprint_id()
-        spinner_message[0] = "Fetching sprint metadata..."
+        show_progress("Fetching sprint metadata...")
         # Fetch sprint metadata once (name, dates) instead of 3 separate API calls
         sprint_data = get_cached_sprint_metadata(JIRA_URL, sprint_id)
         sprint_name = sprint_data.get("name", f"Sprint_{sprint_id}")
         sprint_start = sprint_data.get("startDate", "")[:10] if sprint_data.get("startDate") else None
         sprint_end = sprint_data.get("endDate", "")[:10] if sprint_data.get("endDate") else None
-        spinner_message[0] = "Fetching issues for current sprint..."
-        issues = get_issues(sprint_id, expand_changelog=True)
-        spinner_message[0] = "Marking mid-sprint additions..."
+        show_progress("Fetching issues for current sprint...")
+        issues = get_issues(sprint_id, expand_changelog=True, fields=SPRINT_ISSUE_FIELDS)
+        show_progress("Marking mid-sprint additions...")
         mark_mid_sprint_additions(issues, sprint_id, sprint_name)
-        spinner_message[0] = "Grouping issues by label..."
+        # The changelog is the bulk of each issue and is only needed for the step above;
+        # drop it so it isn't kept alive for the rest of the run
+        for issue in issues:
+            issue.pop('changelog', None)
+        show_progress("Grouping issues by label...")
         grouped = group_issues_by_label(issues, sprint_id=sprint_id)
-        spinner_message[0] = "Creating PowerPoint presentation..."
-        import re
-        # Replace any character not valid in filenames (non-ASCII, special chars) with underscore
-        safe_sprint_name = re.sub(r'[^\w\-.]', '_', sprint_name, flags=re.ASCII)
-        safe_sprint_name = re.sub(r'_+', '_', safe_sprint_name).strip('_')
+        show_progress("Creating PowerPoint presentation...")
+        safe_sprint_name = _FILENAME_UNSAFE_RE.sub('_', sprint_name)
+        safe_sprint_name = _UNDERSCORE_RUN_RE.sub('_', safe_sprint_name).strip('_')
         filename = f"{safe_sprint_name or 'Sprint'}.pptx"
         # Resolve epic display names (attempt to fetch epic summaries by key)
-        def detect_epic_name_local(fields):
-            candidates = ['customfield_10008', 'customfield_10006', 'epic', 'Epic Link', 'epic_link']
-            for key in candidates:
-                if key in fields and fields.get(key):
-                    val = fields.get(key)
-                    if isinstance(val, dict):
-                        return val.get('key') or val.get('name') or str(val)
-                    if isinstance(val, list) and val:
-                        first = val[0]
-                        if isinstance(first, dict):
-                            return first.get('key') or first.get('name') or str(first)
-                        return str(first)
-                    return str(val)
-            for k, v in fields.items():
-                if 'epic' in k.lower() and v:
-                    if isinstance(v, dict):
-                        return v.get('key') or v.get('name') or str(v)
-                    return str(v)
-            return None
-
         epic_candidates = set()
         for issues_in_label in grouped.values():
             for issue in issues_in_label:
-                epic_id = detect_epic_name_local(issue.get('fields', {}))
+                # Detect once; create_presentation reuses it for the epic slides
+                epic_id = issue['_epic'] = detect_epic_name(issue.get('fields', {}))
                 if epic_id and epic_id != 'None':
                     epic_candidates.add(str(epic_id))
 
         epic_map = {}
         # Batch lookup epic summaries using JQL search to avoid many single-issue requests
-        import re as _re
-        epic_keys = [e for e in epic_candidates if _re.match(r'^[A-Z]+-\d+$', str(e))]
+        epic_keys = [e for e in epic_candidates if _ISSUE_KEY_RE.match(str(e))]
         non_keys = [e for e in epic_candidates if e not in epic_keys]
-        # Fetch keys in chunks (Jira may limit URL length; 50 is a safe chunk)
-        def chunks(lst, n):
-            for i in range(0, len(lst), n):
-                yield lst[i:i+n]
-
         # We'll also try to detect the epic's parent (initiative) via the epic's 'parent' field.
         parent_keys_to_fetch = set()
         epic_parent_map = {}  # epic_key -> parent_key (if present)
@@ -569,8 +754,6 @@ if __name__ == "__main__":
                         return rkey
             # If we didn't already return, try a more permissive approach on linked issues:
             # - accept any linked issue that looks like an EMSS initiative key (EMSS-\d+)
-            import re as _re
-            token_re = _re.compile(r"\bEMSS-\d+\b")
             for link in fields_resp.get('issuelinks', []) or []:
                 for side in ('outwardIssue', 'inwardIssue'):
                     rel = link.get(side)
@@ -580,27 +763,24 @@ if __name__ == "__main__":
                     if not rkey:
                         continue
                     # If the linked key appears to be an EMSS initiative, accept it
-                    if token_re.match(rkey):
+                    if _EMSS_TOKEN_RE.match(rkey):
                         logger.debug("Found EMSS-linked parent key %s in issuelinks", rkey)
                         return rkey
 
             # 4) as a last resort, scan any string field for an EMSS-xxxx token (initiative in other project)
             def _search_for_token(obj):
-                if isinstance(obj, str):
-                    m = token_re.search(obj)
-                    if m:
-                        return m.group(0)
-                    return None
-                if isinstance(obj, dict):
-                    for vv in obj.values():
-                        found = _search_for_token(vv)
-                        if found:
-                            return found
-                if isinstance(obj, list):
-                    for vv in obj:
-                        found = _search_for_token(vv)
-                        if found:
-                            return found
+                # Depth-first walk with an explicit stack (same visit order as recursion)
+                stack = [obj]
+                while stack:
+                    item = stack.pop()
+                    if isinstance(item, str):
+                        m = _EMSS_TOKEN_RE.search(item)
+                        if m:
+                            return m.group(0)
+                    elif isinstance(item, dict):
+                        stack.extend(reversed(list(item.values())))
+                    elif isinstance(item, list):
+                        stack.extend(reversed(item))
                 return None
 
             found = _search_for_token(fields_resp)
@@ -608,45 +788,38 @@ if __name__ == "__main__":
                 logger.debug("Heuristically found parent token %s inside issue fields", found)
                 return found
             return None
-        # Fetch all epics concurrently (10-20x faster than sequential)
-        spinner_message[0] = "Fetching epic metadata (async, 10x faster)..."
-        logger.info("Fetching %d epics concurrently...", len(epic_keys))
-
-        # Sanitize epic keys to prevent injection before passing to async fetcher
-        sanitized_epic_keys = sanitize_jql_list(epic_keys, value_type='key')
-
-        # Fetch all epics in parallel (10 concurrent requests at a time)
-        epic_results = fetch_epics_sync(
-            JIRA_URL,
-            sanitized_epic_keys,
-            (JIRA_EMAIL, JIRA_API_TOKEN),
-            SSL_VERIFY,
-            fields=["summary", "parent", "issuelinks", "description"]
-        )
+        # Epic -> initiative links rarely change: reuse the ones resolved by recent runs
+        # (stored next to the response cache, so --refresh skips them)
+        cached_epic_links = load_cached_entries("epic_parents", EPIC_PARENT_CACHE_TTL)
+        for ek in epic_keys:
+            link = cached_epic_links.get(ek)
+            if not link or not link.get("parent"):
+                continue
+            epic_map[ek] = link.get("display") or ek
+            pk = epic_parent_map[ek] = link["parent"]
+            if link.get("parent_info"):
+                embedded_parent_map.setdefault(pk, link["parent_info"])
+            else:
+                parent_keys_to_fetch.add(pk)
+        epic_keys_to_fetch = [k for k in epic_keys if k not in epic_parent_map]
 
-        # Helper to extract description from nested field structures
-        def _extract_description_from_fields(field_dict, prefer_summary=None):
-            d = field_dict.get('description')
-            if d:
-                return d
-            # look for long string fields that look like descriptions
-            for kk, vv in field_dict.items():
-                if kk in ('summary', 'issuetype', 'status', 'priority'):
-                    continue
-                if isinstance(vv, str) and len(vv.strip()) > 40:
-                    if prefer_summary and vv.strip() == (prefer_summary or '').strip():
-                        continue
-                    return vv
-                if isinstance(vv, dict):
-                    if 'value' in vv and isinstance(vv['value'], str) and len(vv['value'].strip()) > 40:
-                        return vv['value']
-            return ""
+        # Fetch the epics with one 'key in (...)' search per 50 keys instead of a GET per epic
+        show_progress("Fetching epic metadata...")
+        logger.info("Fetching %d epics (%d cached)...", len(epic_keys_to_fetch), len(epic_parent_map))
+
+        # Epics the search does not return keep None (as a failed per-issue GET did)
+        epic_results = dict.fromkeys(epic_keys_to_fetch)
+        for _, edata in search_issues_by_key(epic_keys_to_fetch, ["summary", "parent", "issuelinks", "description"]):
+            for eitem in (edata or {}).get('issues', []):
+                if eitem.get('key') in epic_results:
+                    epic_results[eitem['key']] = eitem
 
         # Process all fetched epics
         for key, issue_data in epic_results.items():
             if issue_data:
                 fields_resp = issue_data.get('fields', {})
-                logger.debug("Async fetch returned issue %s with fields: %s", key, list(fields_resp.keys()))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Epic search returned issue %s with fields: %s", key, list(fields_resp))
 
                 # Extract summary and create display string
                 summary = fields_resp.get('summary')
@@ -656,7 +829,7 @@ if __name__ == "__main__":
                 # Try to find a parent (initiative) reference using heuristics
                 pkey = detect_parent_from_issue(issue_data)
                 if pkey:
-                    logger.debug("Detected parent %s for epic %s (async)", pkey, key)
+                    logger.debug("Detected parent %s for epic %s", pkey, key)
                     epic_parent_map[key] = pkey
 
                     # Check if parent is embedded in the response
@@ -664,195 +837,100 @@ if __name__ == "__main__":
                     if pfield and isinstance(pfield, dict) and pfield.get('key') == pkey and pfield.get('fields') and pfield['fields'].get('summary'):
                         # parent embedded with summary — record it so we can use it later without fetching
                         ps = pfield['fields'].get('summary')
-                        pdesc_raw = _extract_description_from_fields(pfield['fields'], prefer_summary=ps)
-                        desc_excerpt = ""
-                        if pdesc_raw:
-                            if isinstance(pdesc_raw, dict):
-                                desc_excerpt = str(pdesc_raw)
-                            else:
-                                desc_excerpt = str(pdesc_raw).splitlines()[0][:120]
-                        display = f"{pkey}: {ps}" if ps else pkey
-                        if desc_excerpt:
-                            display = f"{display} — {desc_excerpt}"
-                        embedded_parent_map[pkey] = {"key": pkey, "display": display, "description": pdesc_raw}
-                        logger.debug("Parent %s embedded; recorded display: %s", pkey, display)
+                        pdesc_raw = _extract_description_from_fields(pfield['fields'], prefer_summary=(ps or '').strip())
+                        info = embedded_parent_map[pkey] = _parent_info(pkey, ps, pdesc_raw)
+                        logger.debug("Parent %s embedded; recorded display: %s", pkey, info["display"])
                     else:
                         parent_keys_to_fetch.add(pkey)
             else:
                 # Epic fetch failed - use key as display
                 epic_map[key] = key
-                logger.debug("Failed to fetch epic %s (async)", key)
+                logger.debug("Failed to fetch epic %s", key)
 
         # For any epics where we still don't have a parent detected, try linkedIssues search
-        missing_parents = [k for k in epic_keys if k not in epic_parent_map]
-        # First, try a per-issue GET for any epics where the batch JQL didn't expose parent info
+        missing_parents = [k for k in epic_keys_to_fetch if k not in epic_parent_map]
+        # Re-read the epics still missing a parent with all fields: one JQL search per 50 epics,
+        # and a per-issue GET only for keys the search did not return
         if missing_parents:
+            full_epics = {}
+            for _, mdata in search_issues_by_key(missing_parents, ["*all"]):
+                for mitem in (mdata or {}).get('issues', []):
+                    if mitem.get('key'):
+                        full_epics[mitem['key']] = mitem
             for ek in list(missing_parents):
-                try:
-                    url_issue = f"{JIRA_URL}/rest/api/2/issue/{ek}"
-                    r = _JIRA_SESSION.get(url_issue, params={"fields": "*all", "expand": "names,renderedFields"}, timeout=15)
-                    if r.status_code == 200:
-                        d = r.json()
-                        logger.debug("Per-issue GET returned for %s fields: %s", ek, list(d.get('fields', {}).keys()))
-                        pkey = detect_parent_from_issue(d)
-                        if pkey:
-                            epic_parent_map[ek] = pkey
-                            parent_obj = d.get('fields', {}).get('parent')
-                            if parent_obj and isinstance(parent_obj, dict) and parent_obj.get('key') == pkey and parent_obj.get('fields') and parent_obj['fields'].get('summary'):
-                                ps = parent_obj['fields'].get('summary')
-                                # try to extract description from fields
-                                def _extract_description_from_fields(field_dict, prefer_summary=None):
-                                    dsc = field_dict.get('description')
-                                    if dsc:
-                                        return dsc
-                                    for kk, vv in field_dict.items():
-                                        if kk in ('summary', 'issuetype', 'status', 'priority'):
-                                            continue
-                                        if isinstance(vv, str) and len(vv.strip()) > 40:
-                                            if prefer_summary and vv.strip() == (prefer_summary or '').strip():
-                                                continue
-                                            return vv
-                                        if isinstance(vv, dict):
-                                            if 'value' in vv and isinstance(vv['value'], str) and len(vv['value'].strip()) > 40:
-                                                return vv['value']
-                                    return ""
-
-                                pdesc_raw = _extract_description_from_fields(parent_obj['fields'], prefer_summary=ps)
-                                desc_excerpt = ""
-                                if pdesc_raw:
-                                    if isinstance(pdesc_raw, dict):
-                                        desc_excerpt = str(pdesc_raw)
-                                    else:
-                                        desc_excerpt = str(pdesc_raw).splitlines()[0][:120]
-                                display = f"{pkey}: {ps}" if ps else pkey
-                                if desc_excerpt:
-                                    display = f"{display} — {desc_excerpt}"
-                                embedded_parent_map[pkey] = {"key": pkey, "display": display, "description": pdesc_raw}
-                                logger.debug("Per-issue parent %s embedded; recorded display: %s", pkey, display)
-                            else:
-                                parent_keys_to_fetch.add(pkey)
-                            # remove from missing_parents list since we found something
-                            if ek in missing_parents:
-                                missing_parents.remove(ek)
-                except Exception:
-                    logger.debug("Per-issue GET failed for %s", ek, exc_info=True)
+                d = full_epics.get(ek)
+                if d is None:
+                    try:
+                        url_issue = f"{JIRA_URL}/rest/api/2/issue/{ek}"
+                        r = _JIRA_SESSION.get(url_issue, params={"fields": "*all", "expand": "names,renderedFields"}, timeout=15)
+                        if r.status_code != 200:
+                            continue
+                        d = decode_json_response(r)
+                    except Exception:
+                        logger.debug("Per-issue GET failed for %s", ek, exc_info=True)
+                        continue
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full issue read for %s fields: %s", ek, list(d.get('fields', {})))
+                pkey = detect_parent_from_issue(d)
+                if not pkey:
+                    continue
+                epic_parent_map[ek] = pkey
+                parent_obj = d.get('fields', {}).get('parent')
+                if parent_obj and isinstance(parent_obj, dict) and parent_obj.get('key') == pkey and parent_obj.get('fields') and parent_obj['fields'].get('summary'):
+                    ps = parent_obj['fields'].get('summary')
+                    pdesc_raw = _extract_description_from_fields(parent_obj['fields'], prefer_summary=(ps or '').strip())
+                    info = embedded_parent_map[pkey] = _parent_info(pkey, ps, pdesc_raw)
+                    logger.debug("Per-issue parent %s embedded; recorded display: %s", pkey, info["display"])
+                else:
+                    parent_keys_to_fetch.add(pkey)
+                # remove from missing_parents list since we found something
+                missing_parents.remove(ek)
 
         if missing_parents:
-            for ek in missing_parents:
-                # First try: look for Initiative in EMSS project linked to this epic
-                # Sanitize epic key to prevent JQL injection
-                ek_sanitized = sanitize_jql_value(ek, value_type='key')
-                jql1 = f'project = EMSS AND issue in linkedIssues("{ek_sanitized}") AND issuetype = Initiative'
-                search_url = f"{JIRA_URL}/rest/api/3/search/jql"
-                payload1 = {"jql": jql1, "fields": "summary", "maxResults": 5}
-                try:
-                    data1 = jql_search(payload1)
-                    if data1:
-                        issues1 = data1.get('issues', [])
-                        if issues1:
-                            pk = issues1[0].get('key')
-                            epic_parent_map[ek] = pk
-                            parent_keys_to_fetch.add(pk)
-                            continue
-                except Exception:
-                    pass
-                # Fallback: any linked issue (take first), across projects
-                # Sanitize epic key to prevent JQL injection
-                ek_sanitized = sanitize_jql_value(ek, value_type='key')
-                jql2 = f'issue in linkedIssues("{ek_sanitized}")'
-                payload2 = {"jql": jql2, "fields": "summary", "maxResults": 5}
-                try:
-                    data2 = jql_search(payload2)
-                    if data2:
-                        issues2 = data2.get('issues', [])
-                        if issues2:
-                            pk = issues2[0].get('key')
-                            epic_parent_map[ek] = pk
-                            parent_keys_to_fetch.add(pk)
-                except Exception:
-                    pass
+            # Up to two linkedIssues searches per epic; the epics are independent, so search concurrently
+            with ThreadPoolExecutor(max_workers=min(JQL_SEARCH_WORKERS, len(missing_parents))) as pool:
+                for ek, pk in zip(missing_parents, pool.map(find_linked_parent, missing_parents)):
+                    if pk:
+                        epic_parent_map[ek] = pk
+                        parent_keys_to_fetch.add(pk)
 
         # Now fetch parent (initiative) details for any parents we need (summary/description)
-        initiative_map = {}  # parent_key -> display string (key: summary - short description)
+        initiative_map = {}  # parent_key -> info dict (key, display "key: summary — short description", description)
         if parent_keys_to_fetch:
             parent_keys = list(parent_keys_to_fetch)
-            for pchunk in chunks(parent_keys, 50):
-                # Sanitize parent keys to prevent JQL injection
-                sanitized_pchunk = sanitize_jql_list(pchunk, value_type='key')
-                pq = ",".join(sanitized_pchunk)
-                pjql = f"key in ({pq})"
-                # Use the API v3 JQL search endpoint
-                purl = f"{JIRA_URL}/rest/api/3/search/jql"
-                ppayload = {"jql": pjql, "fields": "summary,description", "maxResults": 100}
-                try:
-                    pdata = jql_search(ppayload)
-                    if pdata:
-                        for pitem in pdata.get('issues', []):
-                            pkey = pitem.get('key')
-                            pfields = pitem.get('fields', {})
-                            psummary = pfields.get('summary')
-
-                            def _extract_description_from_fields(field_dict, prefer_summary=None):
-                                d = field_dict.get('description')
-                                if d:
-                                    return d
-                                for kk, vv in field_dict.items():
-                                    if kk in ('summary', 'issuetype', 'status', 'priority'):
-                                        continue
-                                    if isinstance(vv, str) and len(vv.strip()) > 40:
-                                        if prefer_summary and vv.strip() == (prefer_summary or '').strip():
-                                            continue
-                                        return vv
-                                    if isinstance(vv, dict):
-                                        if 'value' in vv and isinstance(vv['value'], str) and len(vv['value'].strip()) > 40:
-                                            return vv['value']
-                                return ""
-
-                            pdescription_raw = _extract_description_from_fields(pfields, prefer_summary=psummary)
-                            # Use first line or short excerpt of description to keep slides tidy
-                            desc_excerpt = ""
-                            if pdescription_raw:
-                                if isinstance(pdescription_raw, dict):
-                                    desc_excerpt = str(pdescription_raw)
-                                else:
-                                    desc_excerpt = str(pdescription_raw).splitlines()[0][:120]
-                            display = f"{pkey}: {psummary}" if psummary else pkey
-                            if desc_excerpt:
-                                display = f"{display} — {desc_excerpt}"
-                            initiative_map[pkey] = {"key": pkey, "display": display, "description": pdescription_raw}
-                    else:
-                        # On failure, at least seed with keys
-                        for pk in pchunk:
-                            initiative_map[pk] = pk
-                except Exception:
-                    for pk in pchunk:
-                        initiative_map[pk] = pk
-
-        # Merge any embedded parent displays we discovered earlier so we don't need to fetch them
-        # (embedded_parent_map is populated when per-issue JSON contained a parent object with summary).
-        if embedded_parent_map:
-            for pk, info in embedded_parent_map.items():
-                if pk not in initiative_map:
-                    # info is a dict {display, description}
-                    # ensure embedded info has the key present
-                    if isinstance(info, dict) and 'key' not in info:
-                        info['key'] = pk
-                    initiative_map[pk] = info
-                    logger.debug("Seeded initiative_map from embedded_parent_map for %s -> %s", pk, info.get('display'))
-
-        # Build epic -> initiative display mapping to pass into presentation (epic_goals param)
+            for pchunk, pdata in search_issues_by_key(parent_keys, ["summary", "description"]):
+                if not pdata:
+                    # On failure these parents fall back to showing their key below
+                    continue
+                for pitem in pdata.get('issues', []):
+                    pkey = pitem.get('key')
+                    pfields = pitem.get('fields', {})
+                    psummary = pfields.get('summary')
+                    pdescription_raw = _extract_description_from_fields(pfields, prefer_summary=(psummary or '').strip())
+                    initiative_map[pkey] = _parent_info(pkey, psummary, pdescription_raw)
+
+        # Build epic -> initiative display mapping to pass into presentation (epic_goals param).
+        # Prefer fetched initiative info, then parent info embedded in the epic JSON (or cached).
+        parent_info_by_key = ChainMap(initiative_map, embedded_parent_map)
         epic_initiative_map = {}
         for epic_key, parent_key in epic_parent_map.items():
-            # Prefer a fetched initiative info (dict), then an embedded parent info dict, then fall back to showing the raw parent key.
-            if parent_key in initiative_map:
-                epic_initiative_map[epic_key] = initiative_map[parent_key]
-            elif parent_key in embedded_parent_map:
-                epic_initiative_map[epic_key] = embedded_parent_map[parent_key]
-            elif parent_key:
+            info = parent_info_by_key.get(parent_key) if parent_key else None
+            if info is None and parent_key:
                 # We couldn't fetch summary/description due to permissions or API errors. Show the raw key so the slide isn't blank.
-                epic_initiative_map[epic_key] = {"key": parent_key, "display": parent_key, "description": ""}
-            else:
-                epic_initiative_map[epic_key] = None
+                info = {"key": parent_key, "display": parent_key, "description": ""}
+            epic_initiative_map[epic_key] = info
+
+        # Remember the links resolved this run; a parent shown only by key is fetched again next time
+        fresh_links = {}
+        for ek in epic_keys_to_fetch:
+            pk = epic_parent_map.get(ek)
+            if not pk or not epic_results.get(ek):
+                continue
+            info = epic_initiative_map.get(ek)
+            if info and info.get("display") == info.get("key"):
+                info = None
+            fresh_links[ek] = {"display": epic_map.get(ek, ek), "parent": pk, "parent_info": info}
+        store_cached_entries("epic_parents", fresh_links)
 
         # Non-key epics: use the value itself as display
         for nk in non_keys:
@@ -864,40 +942,32 @@ if __name__ == "__main__":
                 itype = issue.get('fields', {}).get('issuetype', {}).get('name', '')
             except Exception:
                 itype = ''
-            return itype and itype.lower() in ('story', 'task')
-
-        DONE_STATUSES = {"done", "closed", "resolved"}
-        CANCELLED_STATUSES = {"cancelled", "canceled", "removed", "declined"}
+            return itype and itype.lower() in PLANNABLE_ISSUE_TYPES
 
         # In-progress stories from current sprint
         in_progress = []
         for issues_in_label in grouped.values():
             for issue in issues_in_label:
-                if not _is_story_or_task(issue):
+                fields = issue.get('fields') or {}
+                itype = ((fields.get('issuetype') or {}).get('name') or '').lower()
+                if itype not in PLANNABLE_ISSUE_TYPES:
                     continue
-                status_name = (issue.get('fields', {}).get('status', {}).get('name') or '').lower()
+                status_name = ((fields.get('status') or {}).get('name') or '').lower()
                 if status_name and status_name not in DONE_STATUSES and status_name not in CANCELLED_STATUSES:
                     in_progress.append(issue)
 
         # Stories from the next planned sprint (if present)
         planned_next = []
         try:
-            next_id = get_next_sprint_id()
-            if next_id:
-                next_issues = get_issues(next_id)
-                for ni in next_issues:
-                    if _is_story_or_task(ni):
-                        planned_next.append(ni)
+            for ni in next_sprint_future.result(timeout=BACKGROUND_FETCH_TIMEOUT):
+                if _is_story_or_task(ni):
+                    planned_next.append(ni)
         except Exception as e:
             logger.debug("Could not fetch next sprint issues: %s", e)
 
-        # Merge planned items (dedupe by key)
-        planned_by_key = {}
-        for it in planned_next + in_progress:
-            k = it.get('key')
-            if not k:
-                continue
-            planned_by_key[k] = it
+        # Merge planned items (dedupe by key; an issue in both keeps its planned position
+        # and the current-sprint copy, as before)
+        planned_by_key = {it['key']: it for it in itertools.chain(planned_next, in_progress) if it.get('key')}
         planned_items = list(planned_by_key.values())
 
         # If requested, dump the epic -> initiative mapping so the user can inspect what was discovered
@@ -912,13 +982,7 @@ if __name__ == "__main__":
 
         velocity_history = []
         try:
-            velocity_history = build_velocity_history(
-                JIRA_URL,
-                BOARD_ID,
-                (JIRA_EMAIL, JIRA_API_TOKEN),
-                FIELD_STORY_POINTS,
-                max_sprints=10,
-            )
+            velocity_history = velocity_future.result(timeout=BACKGROUND_FETCH_TIMEOUT)
         except Exception as exc:
             logger.debug("Unable to build velocity history: %s", exc)
 
@@ -933,7 +997,15 @@ if __name__ == "__main__":
             planned_items=planned_items,
             velocity_history=velocity_history,
         )
-        spinner_message[0] = "Done!"
+        show_progress("Done!", emoji="⌛")
     finally:
-        spinner_running = False
-        spinner_thread.join()
+        # Never leave a fetch running past this run: under the menu (same interpreter) it
+        # would keep calling Jira and printing into the next action. Fetches that haven't
+        # started are dropped; a running one is waited for (the deck is already saved).
+        for future in (next_sprint_future, velocity_future):
+            future.cancel()
+        if not (next_sprint_future.done() and velocity_future.done()):
+            show_progress("Waiting for background Jira requests to finish...", emoji="⌛")
+        background.shutdown(wait=True)
+        sys.stdout.write("\r" + " " * 64 + "\r")
+        sys.stdout.flush()
@@ -1,20 +1,28 @@
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 import time as _time
 
 import openpyxl
 from openpyxl.chart import LineChart, Reference
 from openpyxl.utils import get_column_letter
-from jira_config import load_jira_env
+from jira_config import get_jira_session, load_jira_env
 from jira_metrics import achieved_points_and_time, get_recent_sprints, get_sprint_issues
+from jira_performance import enable_response_cache
 
 JIRA_ENV = load_jira_env()
 JIRA_URL = JIRA_ENV.get("JT_JIRA_URL", "https://equinixjira.atlassian.net/").rstrip("/")
-JIRA_EMAIL = JIRA_ENV.get("JT_JIRA_USERNAME")
-JIRA_API_TOKEN = JIRA_ENV.get("JT_JIRA_PASSWORD")
 BOARD_ID = JIRA_ENV.get("JT_JIRA_BOARD")
 FIELD_STORY_POINTS = JIRA_ENV.get("JT_JIRA_FIELD_STORY_POINTS", "customfield_10024")
-AUTH = (JIRA_EMAIL, JIRA_API_TOKEN)
+
+# Shared session for all Jira API calls
+_JIRA_SESSION = get_jira_session()
+# Sprints are fetched in parallel; each fetch also pages concurrently
+SPRINT_FETCH_WORKERS = 4
+FORECAST_FIELDS = ("status", "assignee", FIELD_STORY_POINTS, "timetracking")
+# Autosized Excel columns are capped at this many characters
+MAX_COLUMN_WIDTH = 60
 
 
 def get_team_members(issues):
@@ -26,6 +34,16 @@ def get_team_members(issues):
     return sorted(members)
 
 
+def summarize_sprint(sprint):
+    """Fetch a sprint's issues and reduce them to achieved points/time and members.
+
+    Only the summary is returned, so the issue list can be freed as soon as the sprint is done.
+    """
+    issues = get_sprint_issues(JIRA_URL, sprint["id"], fields=FORECAST_FIELDS, session=_JIRA_SESSION)
+    pts, tlog = achieved_points_and_time(issues, FIELD_STORY_POINTS)
+    return {"sprint": sprint, "points": pts, "time": tlog, "members": get_team_members(issues)}
+
+
 def prompt_availability(members):
     print("\nEnter the number of days each team member is available in the coming sprint:")
     avail = {}
@@ -52,43 +70,50 @@ def try_save_workbook(wb, excel_name):
 
 def main():
     print("Fetching last 10 completed sprints...")
-    sprints = get_recent_sprints(JIRA_URL, BOARD_ID, AUTH, state="closed", max_results=10)
+    sprints = get_recent_sprints(JIRA_URL, BOARD_ID, state="closed", max_results=10, session=_JIRA_SESSION)
     if not sprints:
         print("No completed sprints found.")
         return
     print("Sprints:")
     for s in sprints:
         print(f"  {s['name']} ({s.get('startDate', '')[:10]} to {s.get('endDate', '')[:10]})")
-    results = []
+    with ThreadPoolExecutor(max_workers=SPRINT_FETCH_WORKERS) as pool:
+        results = list(pool.map(summarize_sprint, sprints))
     all_members = set()
-    for s in sprints:
-        issues = get_sprint_issues(JIRA_URL, s["id"], AUTH)
-        pts, tlog = achieved_points_and_time(issues, FIELD_STORY_POINTS)
-        members = get_team_members(issues)
-        all_members.update(members)
-        results.append({"sprint": s, "points": pts, "time": tlog, "members": members})
+    for r in results:
+        all_members.update(r["members"])
     # Prompt for availability
     all_members = sorted(all_members)
     avail = prompt_availability(all_members)
     total_avail = sum(avail.values())
+    # Running totals over the sprints (most recent first): the total of the last k
+    # sprints is prefix[k - 1], computed in one pass instead of one sum() per window
+    n_sprints = len(results)
+    pts_prefix = list(accumulate(r["points"] for r in results))
+    time_prefix = list(accumulate(r["time"] for r in results))
+    avail_prefix = list(accumulate(len(r["members"])*10 for r in results))  # 10d per member
+
+    def window_total(prefix, k):
+        return prefix[min(k, n_sprints) - 1]
+
     # Estimate average available days in past sprints
-    avg_avail_1 = len(results[0]["members"])*10 if results[0]["members"] else total_avail  # fallback: 10d per member
-    avg_avail_3 = sum(len(r["members"])*10 for r in results[:3]) / 3 if results[:3] else total_avail
-    avg_avail_5 = sum(len(r["members"])*10 for r in results[:5]) / 5 if results[:5] else total_avail
-    avg_avail_10 = sum(len(r["members"])*10 for r in results[:10]) / 10 if results[:10] else total_avail
+    avg_avail_1 = avail_prefix[0] or total_avail  # fallback: no members recorded
+    avg_avail_3 = window_total(avail_prefix, 3) / 3
+    avg_avail_5 = window_total(avail_prefix, 5) / 5
+    avg_avail_10 = window_total(avail_prefix, 10) / 10
     # Calculate averages
     def fmt_time(sec):
         h = int(sec)//3600
         m = (int(sec)%3600)//60
         return f"{h}h {m}m"
-    avg_pts_1 = results[0]["points"]
-    avg_pts_3 = sum(r["points"] for r in results[:3]) / 3
-    avg_pts_5 = sum(r["points"] for r in results[:5]) / 5
-    avg_pts_10 = sum(r["points"] for r in results[:10]) / min(10, len(results))
-    avg_time_1 = results[0]["time"]
-    avg_time_3 = sum(r["time"] for r in results[:3]) / 3
-    avg_time_5 = sum(r["time"] for r in results[:5]) / 5
-    avg_time_10 = sum(r["time"] for r in results[:10]) / min(10, len(results))
+    avg_pts_1 = pts_prefix[0]
+    avg_pts_3 = window_total(pts_prefix, 3) / 3
+    avg_pts_5 = window_total(pts_prefix, 5) / 5
+    avg_pts_10 = window_total(pts_prefix, 10) / min(10, n_sprints)
+    avg_time_1 = time_prefix[0]
+    avg_time_3 = window_total(time_prefix, 3) / 3
+    avg_time_5 = window_total(time_prefix, 5) / 5
+    avg_time_10 = window_total(time_prefix, 10) / min(10, n_sprints)
     # Scale by availability
     scale_1 = total_avail / avg_avail_1 if avg_avail_1 else 1
     scale_3 = total_avail / avg_avail_3 if avg_avail_3 else 1
@@ -118,10 +143,7 @@ def main():
             ws = wb.create_sheet("Sprint History")
             ws.append(["Sprint Name", "Sprint Start", "Sprint End", "Achieved Story Points", "Achieved Time (h)"])
         # Get existing sprint names to avoid duplicates
-        existing_sprints = set()
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if row and row[0]:
-                existing_sprints.add(row[0])
+        existing_sprints = {name for (name,) in ws.iter_rows(min_row=2, max_col=1, values_only=True) if name}
         # Append only new sprints
         for r in results:
             s = r["sprint"]
@@ -143,9 +165,9 @@ def main():
             start = s.get("startDate", "")[:10]
             end = s.get("endDate", "")[:10]
             ws.append([s["name"], start, end, pts, round(tlog/3600, 2)])
-    # Add or update chart to Sprint History
-    for obj in ws._charts:
-        ws._charts.remove(obj)
+    # Add or update chart to Sprint History (drop every existing chart; removing
+    # while iterating skipped every other one)
+    ws._charts.clear()
     chart = LineChart()
     chart.title = "Achieved Story Points and Hours per Sprint"
     chart.y_axis.title = "Story Points / Hours (Done/Closed/Resolved)"
@@ -188,20 +210,29 @@ def main():
     chart2.x_axis.title = "Window (Last N Sprints Used for Average)"
     chart2.y_axis.title = "Forecasted Story Points / Hours (scaled for next sprint)"
     ws2.add_chart(chart2, f"G2")
-    # Autosize columns
+    # Autosize columns (values only, no cell objects); stop scanning once a column hits the cap
     for wsx in [ws, ws2]:
-        for col in wsx.columns:
+        for col_idx, values in enumerate(wsx.iter_cols(values_only=True), start=1):
             max_length = 0
-            col_letter = get_column_letter(col[0].column)
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            wsx.column_dimensions[col_letter].width = max_length + 2
+            for value in values:
+                if value is None:
+                    continue
+                length = len(value) if isinstance(value, str) else len(str(value))
+                if length > max_length:
+                    max_length = length
+                    if max_length >= MAX_COLUMN_WIDTH:
+                        max_length = MAX_COLUMN_WIDTH
+                        break
+            wsx.column_dimensions[get_column_letter(col_idx)].width = max_length + 2
     try_save_workbook(wb, excel_name)
     print(f"\nExcel file with sprint history and forecast saved as: {excel_name}")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Forecast next sprint capacity (Excel export)")
+    parser.add_argument("--no-cache", "--refresh", action="store_true", help="Always fetch fresh sprint data instead of reusing responses cached in .jpt_cache (10 min for sprint lists, 15 min for sprint issues)")
+    args = parser.parse_args()
+    if not args.no_cache:
+        enable_response_cache()
     main()
@@ -1,9 +1,17 @@
+import logging
+import runpy
 import subprocess
 import sys
 import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-MENU = [
+# Menu entry that runs CHECK_COMMANDS instead of a single script
+RUN_ALL_CHECKS = "run_all_checks"
+
+MENU = (
     ("Generate Sprint PowerPoint Presentation", "jpt.py"),
     ("Send Jira TODO Notification Email", "jira_todo_notify.py"),
     ("Check 'To Refine' Stories & Epics (Sanity Check)", "jira_refine_sanity_check.py"),
@@ -11,11 +19,106 @@ MENU = [
     ("Show 'On Hold' Stories Overview", "jira_on_hold_overview.py"),
     ("Show Blocked Stories Overview", "jira_blocked_overview.py"),
     ("Forecast Next Sprint Capacity (Excel Export)", "jpt_forecast.py"),
-    ("Exit", None)
-]
+    ("Run All Sanity Checks & Overviews (Report Only)", RUN_ALL_CHECKS),
+    ("Exit", None),
+)
+
+# Read-only reports started together by the "Run All Sanity Checks" menu action
+CHECK_COMMANDS = (
+    ("jira_refine_sanity_check.py", "--report-only"),
+    ("jira_ready_sanity_check.py", "--report-only"),
+    ("jira_on_hold_overview.py",),
+    ("jira_blocked_overview.py",),
+)
+# How many checks may talk to Jira at the same time (override with JT_MAX_CONCURRENT)
+DEFAULT_MAX_CONCURRENT = 4
+
+# Explanations shown before running each script
+EXPLANATIONS = {
+    "jira_blocked_overview.py": (
+        "Show Blocked Stories Overview\n"
+        "-----------------------------\n"
+        "Displays all stories that are blocked by another work item, including summary, labels, assignee, blockers, and a direct Jira link.\n"
+    ),
+    "jpt.py": (
+        "Generate Sprint PowerPoint presentation\n"
+        "--------------------------------------\n"
+        "Fetches Jira sprint data and generates a PowerPoint presentation using a template.\n"
+        "Groups issues by label, displays issue details, and includes summary and upcoming slides.\n"
+        "Ensure 'sprint-template.pptx' is present in the script directory."
+    ),
+    "jira_todo_notify.py": (
+        "Send Jira TODO notification email\n"
+        "-------------------------------\n"
+        "Sends a notification email for Jira TODOs.\n"
+        "Supports SMTP/Outlook, test mode, and HTML/plain text. Configure credentials in .env or as prompted."
+    ),
+    "jira_refine_sanity_check.py": (
+        "Run Jira refine sanity check\n"
+        "----------------------------\n"
+        "Checks all Epics and Stories in 'To Refine' state for missing labels and acceptance criteria.\n"
+        "Acceptance criteria must be a markdown list in the custom field. Results are grouped by Epic."
+    ),
+    "jira_ready_sanity_check.py": (
+        "Run Jira 'Ready' sanity check\n"
+        "-----------------------------\n"
+        "Checks all Stories in 'Ready' state for missing acceptance criteria and for a valid label.\n"
+        "A story is only 'Ready' if it has acceptance criteria (markdown list) and a label from the PowerPoint generator's list."
+    ),
+    "jira_on_hold_overview.py": (
+        "Show 'On Hold' Stories Overview\n"
+        "-------------------------------\n"
+        "Displays all stories with status 'On hold', including summary, labels, assignee, and a direct Jira link.\n"
+    ),
+    "jpt_forecast.py": (
+        "Forecast Next Sprint Capacity (Excel Export)\n"
+        "-------------------------------------------\n"
+        "Fetches last 10 sprints, calculates achieved points/time, prompts for team availability, and forecasts next sprint's capacity.\n"
+        "Exports results and forecast to Excel, appending new sprints only, with trend charts. Close the Excel file before running."
+    ),
+    RUN_ALL_CHECKS: (
+        "Run All Sanity Checks & Overviews\n"
+        "---------------------------------\n"
+        "Runs the 'To Refine' and 'Ready' sanity checks and the 'On Hold' and Blocked overviews at the same time.\n"
+        "Reports only: nothing is changed in Jira. Run a check on its own to fix labels or move stories."
+    ),
+}
+
+# ANSI "cursor home + clear screen"; written directly instead of spawning a shell per redraw
+_ANSI_CLEAR = "\x1b[H\x1b[2J"
+
+
+# Windows: ENABLE_VIRTUAL_TERMINAL_PROCESSING console mode flag and the stdout handle id
+_ENABLE_VT_PROCESSING = 0x0004
+_STD_OUTPUT_HANDLE = -11
+
+
+@lru_cache(maxsize=1)
+def _ansi_clear_supported():
+    """Return True if the terminal understands _ANSI_CLEAR (decided once per process)."""
+    if not sys.stdout.isatty() or os.environ.get('TERM') == 'dumb':
+        return False
+    if os.name != 'nt':
+        return True
+    # Windows 10+ consoles handle ANSI sequences once virtual terminal processing is on
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(_STD_OUTPUT_HANDLE)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VT_PROCESSING))
+    except (AttributeError, OSError):
+        return False
+
 
 def clear():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _ansi_clear_supported():
+        sys.stdout.write(_ANSI_CLEAR)
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 def prompt_zscaler_usage():
     """Prompt user once about SSL configuration and set environment variable."""
@@ -78,57 +181,97 @@ def check_legacy_ssl_config():
         # If we can't load config, skip warning
         pass
 
-def main():
+def _reset_tool_state():
+    """Undo the process-wide state a tool run leaves behind, so the next tool starts clean.
+
+    The project modules stay loaded, so their per-process caches (env file, Jira session,
+    certificate path) carry over between menu actions; the session and env caches are keyed
+    on .jira_environment's mtime, so an edited file is still picked up. Only what a tool
+    switches on for its own run is reset: jpt enables the on-disk response cache.
+    """
+    performance = sys.modules.get("jira_performance")
+    if performance is not None:
+        performance.disable_response_cache()
+
+
+def run_script(script):
+    """Run a tool script in this interpreter, as ``python script`` would, and return its exit code.
+
+    Libraries the tools share (requests, python-pptx, openpyxl) are imported once and
+    reused by later menu actions instead of being re-imported by a new interpreter.
+    Root logging and the response cache are reset after each run (see _reset_tool_state).
+    """
+    saved_argv = sys.argv
+    root = logging.getLogger()
+    saved_root_handlers, saved_root_level = root.handlers[:], root.level
+    sys.argv = [script]
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code)
+        return 1
+    except KeyboardInterrupt:
+        print("\nInterrupted.")
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+        _reset_tool_state()
+        root.handlers[:] = saved_root_handlers
+        root.setLevel(saved_root_level)
+    return 0
+
+
+def _max_concurrent():
+    try:
+        return max(1, int(os.environ.get("JT_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT
+
+
+def _run_check(command):
+    """Run one check in its own process and return its exit code and combined output."""
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+    proc = subprocess.run(
+        [sys.executable, *command],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env,
+        encoding="utf-8",
+        errors="replace",
+    )
+    return proc.returncode, proc.stdout
+
+
+def run_all_checks():
+    """Run the read-only checks concurrently and print their reports in menu order.
+
+    Each check waits on Jira for most of its run time, so starting them together makes the
+    whole batch take about as long as the slowest check instead of the sum of all of them.
+    """
+    workers = min(_max_concurrent(), len(CHECK_COMMANDS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_run_check, CHECK_COMMANDS)
+        for command, (returncode, output) in zip(CHECK_COMMANDS, results):
+            script = command[0]
+            print(f"\n===== {script} =====")
+            print(output.rstrip())
+            if returncode:
+                print(f"\nScript '{script}' exited with error code {returncode}.")
+
+
+def main(use_subprocess=False):
     # Prompt for Zscaler usage once at startup
     prompt_zscaler_usage()
 
     # Check for deprecated SSL configuration
     check_legacy_ssl_config()
 
-    # Explanations for each script
-    EXPLANATIONS = {
-        "jira_blocked_overview.py": (
-            "Show Blocked Stories Overview\n"
-            "-----------------------------\n"
-            "Displays all stories that are blocked by another work item, including summary, labels, assignee, blockers, and a direct Jira link.\n"
-        ),
-        "jpt.py": (
-            "Generate Sprint PowerPoint presentation\n"
-            "--------------------------------------\n"
-            "Fetches Jira sprint data and generates a PowerPoint presentation using a template.\n"
-            "Groups issues by label, displays issue details, and includes summary and upcoming slides.\n"
-            "Ensure 'sprint-template.pptx' is present in the script directory."
-        ),
-        "jira_todo_notify.py": (
-            "Send Jira TODO notification email\n"
-            "-------------------------------\n"
-            "Sends a notification email for Jira TODOs.\n"
-            "Supports SMTP/Outlook, test mode, and HTML/plain text. Configure credentials in .env or as prompted."
-        ),
-        "jira_refine_sanity_check.py": (
-            "Run Jira refine sanity check\n"
-            "----------------------------\n"
-            "Checks all Epics and Stories in 'To Refine' state for missing labels and acceptance criteria.\n"
-            "Acceptance criteria must be a markdown list in the custom field. Results are grouped by Epic."
-        ),
-        "jira_ready_sanity_check.py": (
-            "Run Jira 'Ready' sanity check\n"
-            "-----------------------------\n"
-            "Checks all Stories in 'Ready' state for missing acceptance criteria and for a valid label.\n"
-            "A story is only 'Ready' if it has acceptance criteria (markdown list) and a label from the PowerPoint generator's list."
-        ),
-        "jira_on_hold_overview.py": (
-            "Show 'On Hold' Stories Overview\n"
-            "-------------------------------\n"
-            "Displays all stories with status 'On hold', including summary, labels, assignee, and a direct Jira link.\n"
-        ),
-        "jpt_forecast.py": (
-            "Forecast Next Sprint Capacity (Excel Export)\n"
-            "-------------------------------------------\n"
-            "Fetches last 10 sprints, calculates achieved points/time, prompts for team availability, and forecasts next sprint's capacity.\n"
-            "Exports results and forecast to Excel, appending new sprints only, with trend charts. Close the Excel file before running."
-        ),
-    }
     while True:
         clear()
         print("Jira Presentation Tool - Main Menu\n")
@@ -152,15 +295,23 @@ def main():
         print(f"\n--- {desc} ---\n")
         if script in EXPLANATIONS:
             print(EXPLANATIONS[script] + "\n")
-        # Use sys.executable to ensure the same Python environment
-        try:
-            subprocess.run([sys.executable, script], check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"\nScript '{script}' exited with error code {e.returncode}.")
-        except FileNotFoundError:
+        if script == RUN_ALL_CHECKS:
+            run_all_checks()
+        elif not os.path.exists(script):
             print(f"\nScript '{script}' not found.")
+        elif use_subprocess:
+            # Use sys.executable to ensure the same Python environment
+            try:
+                subprocess.run([sys.executable, script], check=True)
+            except subprocess.CalledProcessError as e:
+                print(f"\nScript '{script}' exited with error code {e.returncode}.")
+        else:
+            returncode = run_script(script)
+            if returncode:
+                print(f"\nScript '{script}' exited with error code {returncode}.")
         print("\nPress Enter to return to the menu...")
         input()
 
 if __name__ == "__main__":
-    main()
+    # --subprocess runs each tool in its own Python process (slower, fully isolated)
+    main(use_subprocess="--subprocess" in sys.argv[1:])
@@ -7,14 +7,224 @@ Split from jpt.py for modularity.
 
 import sys
 import os
+import time
+from functools import lru_cache
+from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt, Inches
 from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
 import logging
+from typing import NamedTuple, Optional
 
 logger = logging.getLogger("jpt_presentation")
 
+# Font sizes shared by every slide (built once instead of per paragraph)
+STORY_FONT_SIZE = Pt(16)
+DESCRIPTION_FONT_SIZE = Pt(12)
+ITEM_FONT_SIZE = Pt(11)
+AXIS_FONT_SIZE = Pt(11)
+
+DONE_STATUSES = frozenset(("done", "closed", "resolved"))
+
+# Initiative slide line prefix by (done, added mid-sprint)
+_STORY_MARKS = {
+    (True, False): "✔️",
+    (True, True): "✔️ ➕",
+    (False, False): "—",
+    (False, True): "— ➕",
+}
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "sprint-template.pptx")
+
+
+@lru_cache(maxsize=1)
+def _read_template_bytes(path, mtime_ns):
+    """Return the template file's bytes; ``mtime_ns`` keys the cache so an edited template is re-read."""
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def _layouts_by_name(prs):
+    """Return the template's slide layouts keyed by normalized (stripped, lower-case) name.
+
+    The first layout with a given name wins, as with a front-to-back scan.
+    """
+    layouts = {}
+    for layout in prs.slide_layouts:
+        layouts.setdefault(layout.name.strip().lower(), layout)
+    return layouts
+
+
+def _get_layout_by_name(layouts, prs, name):
+    return layouts.get(name.strip().lower()) or prs.slide_layouts[0]
+
+
+# Common epic link field keys, tried before scanning field names that contain 'epic'
+EPIC_FIELD_CANDIDATES = (
+    "customfield_10008",
+    "customfield_10006",
+    "epic",
+    "Epic Link",
+    "epic_link",
+)
+
+
+def detect_epic_name(fields):
+    """Extract an epic identifier/name from an issue's fields."""
+    get = fields.get
+    for key in EPIC_FIELD_CANDIDATES:
+        val = get(key)
+        if not val:
+            continue
+        # If it's a dict, try name or key
+        if isinstance(val, dict):
+            return val.get("key") or val.get("name") or str(val)
+        # If it's a list, pick first element
+        if isinstance(val, list):
+            first = val[0]
+            if isinstance(first, dict):
+                return first.get("key") or first.get("name") or str(first)
+            return str(first)
+        return str(val)
+    # Scan all fields for anything with 'epic' in the key
+    for k, v in fields.items():
+        if v and "epic" in k.lower():
+            if isinstance(v, dict):
+                return v.get("key") or v.get("name") or str(v)
+            return str(v)
+    return None
+
+
+def _paginate(lst, n):
+    for i in range(0, len(lst), n):
+        yield lst[i:i+n]
+
+
+def _fill_text_frame(text_frame, lines, size):
+    """Replace a text frame's content with one paragraph per line, sizing each run directly."""
+    text_frame.clear()
+    paragraph = text_frame.paragraphs[0]
+    for i, line in enumerate(lines):
+        if i:
+            paragraph = text_frame.add_paragraph()
+        run = paragraph.add_run()
+        run.text = line
+        run.font.size = size
+
+
+# Placeholder indexes tried, in order, for a content slide's body text
+BODY_PLACEHOLDER_IDXS = (15, 14, 1, 2, 0)
+
+
+def _body_placeholder_idx(layout):
+    """Return the idx of the placeholder that takes body text on slides of ``layout``, or None."""
+    available = {
+        ph.placeholder_format.idx
+        for ph in layout.iter_cloneable_placeholders()
+        if ph.has_text_frame
+    }
+    return next((idx for idx in BODY_PLACEHOLDER_IDXS if idx in available), None)
+
+
+def _fill_body(slide, body_idx, lines):
+    """Write ``lines`` (story font size) into the body placeholder, or a textbox if there is none."""
+    if body_idx is not None:
+        _fill_text_frame(slide.placeholders[body_idx].text_frame, lines, STORY_FONT_SIZE)
+    elif lines:
+        txBox = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(9), Inches(5.0))
+        _fill_text_frame(txBox.text_frame, lines, STORY_FONT_SIZE)
+
+
+def _format_issue_line(issue, details=True):
+    """Return the slide line for an issue.
+
+    With details, the line carries the mid-sprint marker, assignee and status
+    (label slides); without, it is just ``KEY: summary`` (planned items).
+    """
+    get = issue.get("fields", {}).get
+    if not details:
+        return f"{issue.get('key')}: {get('summary', '')}"
+    # Check if issue was added mid-sprint
+    mid_sprint = "➕ " if issue.get("_added_mid_sprint") else ""
+    assignee = get("assignee")
+    display_name = assignee.get("displayName", "") if isinstance(assignee, dict) else ""
+    status_name = (get("status") or {}).get("name", "")
+    return (
+        f"{mid_sprint}{issue.get('key')}: {get('summary', '')}"
+        f"{' ' + display_name if display_name else ''}"
+        f"{' [' + status_name + ']' if status_name else ''}"
+    )
+
+
+class IssueRow(NamedTuple):
+    """Slide-ready view of one issue; only the fields the slides render."""
+
+    key: Optional[str]
+    summary: str
+    status_lc: str
+    done: bool
+    mid_sprint: bool
+    epic: Optional[str]
+    line: str
+
+
+def _decode_issue(issue):
+    """Decode the fields the slides read from ``issue`` in one pass.
+
+    Label slides, the epic grouping and the initiative slides all work from the
+    returned compact row instead of walking ``issue["fields"]`` again.
+    """
+    fields = issue.get("fields", {})
+    status_lc = (fields.get("status") or {}).get("name", "").lower()
+    return IssueRow(
+        key=issue.get("key"),
+        summary=fields.get("summary", ""),
+        status_lc=status_lc,
+        done=status_lc in DONE_STATUSES,
+        mid_sprint=bool(issue.get("_added_mid_sprint")),
+        # jpt.py stores the epic it already detected as "_epic"; only re-detect if missing
+        epic=issue["_epic"] if "_epic" in issue else detect_epic_name(fields),
+        line=_format_issue_line(issue),
+    )
+
+
+def _truncate(text, length=100):
+    if not text:
+        return ""
+    s = str(text).strip()
+    if len(s) <= length:
+        return s
+    return s[:length-1].rsplit(' ', 1)[0] + '…'
+
+
+def _save_presentation(prs, filename, attempts=3, delay=0.5):
+    """Save ``prs`` to ``filename`` via a temp file and an atomic rename.
+
+    The deck is written once to ``<filename>.part``; only the rename is retried
+    when the target is locked (e.g. open in PowerPoint). After ``attempts``
+    failures an interactive run is asked to close the file, a headless run
+    raises the PermissionError instead of waiting on input().
+    """
+    tmp_name = f"{filename}.part"
+    prs.save(tmp_name)
+    attempt = 0
+    while True:
+        try:
+            os.replace(tmp_name, filename)
+            return
+        except PermissionError:
+            attempt += 1
+            if attempt < attempts:
+                time.sleep(delay)
+                continue
+            if not sys.stdin.isatty():
+                os.remove(tmp_name)
+                raise
+            print(f"\nERROR: The file '{filename}' is open in PowerPoint or another program. Please close it and press Enter to continue...")
+            input()
+
+
 def create_presentation(
     grouped_issues,
     sprint_name,
@@ -25,62 +235,32 @@ def create_presentation(
     epic_goals=None,
     planned_items=None,
     velocity_history=None,
+    stream=None,
 ):
     """
     Create a PowerPoint presentation from grouped Jira issues.
     - Each label gets a slide with issues listed in the BODY placeholder.
     - Adds a summary slide showing accomplished work (no points).
     - Adds a final 'thanks' slide if available in the template.
+    - If ``stream`` (a binary file object, e.g. BytesIO) is given, the deck is written
+      there instead of to ``filename``, for callers that send or upload the bytes.
     """
-    template_path = os.path.join(os.path.dirname(__file__), "sprint-template.pptx")
-    if not os.path.exists(template_path):
+    try:
+        template_mtime = os.stat(TEMPLATE_PATH).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             "PowerPoint template 'sprint-template.pptx' not found in the same directory as the script. "
             "Please add the template file and try again."
-        )
-    prs = Presentation(template_path)
-
-    def get_layout_by_name(prs, name):
-        for layout in prs.slide_layouts:
-            if layout.name.strip().lower() == name.strip().lower():
-                return layout
-        return prs.slide_layouts[0]
-
-    # Helper to extract an epic identifier/name from an issue's fields.
-    def detect_epic_name(fields):
-        # Common epic link field keys include: customfield_10008, epic, Epic Link, etc.
-        # Try known keys first then fall back to scanning field names that contain 'epic'.
-        candidates = [
-            "customfield_10008",
-            "customfield_10006",
-            "epic",
-            "Epic Link",
-            "epic_link",
-        ]
-        for key in candidates:
-            if key in fields and fields.get(key):
-                val = fields.get(key)
-                # If it's a dict, try name or key
-                if isinstance(val, dict):
-                    return val.get("key") or val.get("name") or str(val)
-                # If it's a list, pick first element
-                if isinstance(val, list) and val:
-                    first = val[0]
-                    if isinstance(first, dict):
-                        return first.get("key") or first.get("name") or str(first)
-                    return str(first)
-                return str(val)
-        # Scan all fields for anything with 'epic' in the key
-        for k, v in fields.items():
-            if "epic" in k.lower() and v:
-                if isinstance(v, dict):
-                    return v.get("key") or v.get("name") or str(v)
-                return str(v)
-        return None
-
-    title_slide_layout = get_layout_by_name(prs, "Title Slide")
-    title_content_layout = get_layout_by_name(prs, "Title and Content")
-    summary_layout = get_layout_by_name(prs, "Title and Content Blue Hexagon")
+        ) from None
+    # The template is read from disk once per process (re-read when it changes)
+    prs = Presentation(BytesIO(_read_template_bytes(TEMPLATE_PATH, template_mtime)))
+
+    layouts = _layouts_by_name(prs)
+    title_slide_layout = _get_layout_by_name(layouts, prs, "Title Slide")
+    title_content_layout = _get_layout_by_name(layouts, prs, "Title and Content")
+    summary_layout = _get_layout_by_name(layouts, prs, "Title and Content Blue Hexagon")
+    # Label and planned-item slides all use this layout: pick their body placeholder once
+    body_idx = _body_placeholder_idx(title_content_layout)
 
     # Title slide
     title_slide = prs.slides.add_slide(title_slide_layout)
@@ -99,34 +279,19 @@ def create_presentation(
         except Exception:
             pass
 
-    # Slides for each label
-    def _paginate_list(lst, n):
-        for i in range(0, len(lst), n):
-            yield lst[i:i+n]
+    # Decode every issue once; label, epic and initiative slides share these rows
+    rows_by_label = {
+        label: [_decode_issue(issue) for issue in issues]
+        for label, issues in grouped_issues.items()
+    }
 
-    for label, issues in grouped_issues.items():
+    # Slides for each label
+    for label, rows in rows_by_label.items():
         # Build the textual lines for the label slides
-        issue_lines = []
-        for issue in issues:
-            key = issue.get("key")
-            fields = issue.get("fields", {})
-            summary = fields.get("summary", "")
-            status_name = fields.get("status", {}).get("name", "")
-            assignee = fields.get("assignee")
-            display_name = ""
-            if assignee and isinstance(assignee, dict):
-                display_name = assignee.get("displayName", "")
-            # Check if issue was added mid-sprint
-            mid_sprint_marker = "➕ " if issue.get("_added_mid_sprint") else ""
-            issue_text = f"{mid_sprint_marker}{key}: {summary}"
-            if display_name:
-                issue_text += f" {display_name}"
-            if status_name:
-                issue_text += f" [{status_name}]"
-            issue_lines.append(issue_text)
+        issue_lines = [row.line for row in rows]
 
         # Paginate: max 5 stories per slide for label slides
-        pages = list(_paginate_list(issue_lines, 5)) if issue_lines else [[]]
+        pages = list(_paginate(issue_lines, 5)) if issue_lines else [[]]
         total = len(pages)
         for idx, page_lines in enumerate(pages, start=1):
             slide = prs.slides.add_slide(title_content_layout)
@@ -135,39 +300,17 @@ def create_presentation(
                 title_text = f"{label} ({idx}/{total})"
             if slide.shapes.title:
                 slide.shapes.title.text = title_text
-            try:
-                # Try placing into common placeholder indexes; set story font size to 16pt
-                placed = False
-                for ph in (15, 14, 1, 2, 0):
-                    try:
-                        slide.placeholders[ph].text = '\n'.join(page_lines)
-                        for paragraph in slide.placeholders[ph].text_frame.paragraphs:
-                            paragraph.font.size = Pt(16)
-                        placed = True
-                        break
-                    except Exception:
-                        continue
-                if not placed and page_lines:
-                    # Fallback: add a textbox
-                    from pptx.util import Inches
-                    txBox = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(9), Inches(5.0))
-                    tf = txBox.text_frame
-                    tf.text = '\n'.join(page_lines)
-                    for paragraph in tf.paragraphs:
-                        paragraph.font.size = Pt(16)
-            except (KeyError, IndexError, AttributeError):
-                pass
+            _fill_body(slide, body_idx, page_lines)
 
     # Create one slide per epic: show epic title (from epic_map), Goal (if available), and list stories/tasks
     epic_items = {}
-    for label, issues in grouped_issues.items():
-        for issue in issues:
-            fields = issue.get("fields", {})
-            epic_name = detect_epic_name(fields)
+    for rows in rows_by_label.values():
+        for row in rows:
+            epic_name = row.epic
             # Only include issues that have an epic defined; skip those without one
             if not epic_name or epic_name == "None":
                 continue
-            epic_items.setdefault(epic_name, []).append(issue)
+            epic_items.setdefault(epic_name, []).append(row)
 
     if not epic_items:
         # fallback single slide when no epics found
@@ -179,21 +322,6 @@ def create_presentation(
         except Exception:
             pass
     else:
-        # Helpers
-        def chunk_list(lst, n):
-            for i in range(0, len(lst), n):
-                yield lst[i:i+n]
-
-        def truncate(text, length=100):
-            if not text:
-                return ""
-            s = str(text).strip()
-            if len(s) <= length:
-                return s
-            return s[:length-1].rsplit(' ', 1)[0] + '…'
-
-        from pptx.util import Inches
-
         # Build structured data: initiative -> list of (epic_display, items_sorted)
         initiatives = {}
         # We'll also keep a mapping from initiative_display -> description (if available)
@@ -212,7 +340,7 @@ def create_presentation(
             initiative_display = init_text or "No Initiative"
             if initiative_display not in initiative_descriptions and init_desc:
                 initiative_descriptions[initiative_display] = init_desc
-            items_sorted = sorted(items, key=lambda it: it.get("key") or "")
+            items_sorted = sorted(items, key=lambda row: row.key or "")
             initiatives.setdefault(initiative_display, []).append((display_epic, items_sorted))
 
         # -----------------------------
@@ -221,7 +349,7 @@ def create_presentation(
         # One slide per initiative, repeating the initiative header on split slides when necessary.
         for initiative_display, epics in initiatives.items():
             # Flatten epics into chunks of up to 5 epics per slide to avoid overcrowding
-            for ep_batch in chunk_list(epics, 5):
+            for ep_batch in _paginate(epics, 5):
                 slide = prs.slides.add_slide(title_content_layout)
                 if slide.shapes.title:
                     slide.shapes.title.text = f"Initiative: {initiative_display}"
@@ -231,51 +359,40 @@ def create_presentation(
                 # If we have a description for this initiative, render the first paragraph (truncated)
                 idesc = initiative_descriptions.get(initiative_display)
                 if idesc:
-                    desc_text = truncate(idesc, 300)
+                    desc_text = _truncate(idesc, 300)
                     p_desc = tf.add_paragraph()
                     p_desc.text = desc_text
-                    p_desc.font.size = Pt(12)
+                    p_desc.font.size = DESCRIPTION_FONT_SIZE
                     p_desc.font.italic = True
                     tf.add_paragraph()
                 for display_epic, items in ep_batch:
                     p = tf.add_paragraph()
                     p.text = display_epic
-                    p.font.size = Pt(16)
+                    p.font.size = STORY_FONT_SIZE
                     p.font.bold = True
-                    # stories
-                    for issue in items:
-                        f = issue.get("fields", {})
-                        status = f.get("status", {}).get("name", "").lower()
-                        done = status in ("done", "closed", "resolved")
-                        key = issue.get("key")
-                        summary = truncate(f.get("summary", ""), 120)
-                        mark = "✔️" if done else "—"
-                        # Check if issue was added mid-sprint
-                        mid_sprint_marker = " ➕" if issue.get("_added_mid_sprint") else ""
+                    # stories (done ones are counted along the way for the progress line)
+                    done_count = 0
+                    for row in items:
+                        done_count += row.done
+                        summary = _truncate(row.summary, 120)
                         s = tf.add_paragraph()
-                        s.text = f"{mark}{mid_sprint_marker} {key}: {summary} [{status}]"
+                        s.text = f"{_STORY_MARKS[row.done, row.mid_sprint]} {row.key}: {summary} [{row.status_lc}]"
                         s.level = 1
-                        s.font.size = Pt(11)
+                        s.font.size = ITEM_FONT_SIZE
                     prog = tf.add_paragraph()
-                    prog.text = f"Progress: {sum(1 for it in items if it.get('fields', {}).get('status', {}).get('name','').lower() in ('done','closed','resolved'))}/{len(items)} done"
+                    prog.text = f"Progress: {done_count}/{len(items)} done"
                     prog.level = 1
-                    prog.font.size = Pt(11)
+                    prog.font.size = ITEM_FONT_SIZE
                     tf.add_paragraph()
 
     # Thanks slide
     # --- Planned items (next sprint + in-progress) ---
     if planned_items:
         # Build textual lines for planned items (only show KEY: summary)
-        planned_lines = []
-        for issue in planned_items:
-            key = issue.get("key")
-            fields = issue.get("fields", {})
-            summary = fields.get("summary", "")
-            issue_text = f"{key}: {summary}"
-            planned_lines.append(issue_text)
+        planned_lines = [_format_issue_line(issue, details=False) for issue in planned_items]
 
         # Paginate planned items: 5 per slide
-        pages = list(_paginate_list(planned_lines, 5)) if planned_lines else []
+        pages = list(_paginate(planned_lines, 5)) if planned_lines else []
         total = len(pages)
         for idx, page_lines in enumerate(pages, start=1):
             slide = prs.slides.add_slide(title_content_layout)
@@ -284,62 +401,53 @@ def create_presentation(
                 title_text = f"Planned for next sprint ({idx}/{total})"
             if slide.shapes.title:
                 slide.shapes.title.text = title_text
-            try:
-                placed = False
-                for ph in (15, 14, 1, 2, 0):
-                    try:
-                        slide.placeholders[ph].text = '\n'.join(page_lines)
-                        for paragraph in slide.placeholders[ph].text_frame.paragraphs:
-                            paragraph.font.size = Pt(16)
-                        placed = True
-                        break
-                    except Exception:
-                        continue
-                if not placed and page_lines:
-                    txBox = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(9), Inches(5.0))
-                    tf = txBox.text_frame
-                    tf.text = '\n'.join(page_lines)
-                    for paragraph in tf.paragraphs:
-                        paragraph.font.size = Pt(16)
-            except (KeyError, IndexError, AttributeError):
-                pass
+            _fill_body(slide, body_idx, page_lines)
 
     # Velocity slide (based on recent sprint history)
     if velocity_history:
         slide = prs.slides.add_slide(title_content_layout)
         if slide.shapes.title:
             slide.shapes.title.text = f"Velocity (Last {len(velocity_history)} Sprints)"
-        history = list(reversed(velocity_history))  # oldest -> newest
-        categories = [entry.get("name") or "Sprint" for entry in history]
-        points_series = [(entry.get("points") or 0.0) for entry in history]
-        hours_series = [round(((entry.get("time_seconds") or 0) / 3600.0), 1) for entry in history]
-
-        chart_data = CategoryChartData()
-        chart_data.categories = categories
-        chart_data.add_series("Completed Points", points_series)
-        chart_data.add_series("Logged Hours", hours_series)
-
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.LINE_MARKERS,
-            Inches(0.5),
-            Inches(1.4),
-            Inches(9),
-            Inches(4.3),
-            chart_data,
-        ).chart
-        chart.has_legend = True
-        if chart.category_axis:
-            chart.category_axis.tick_labels.font.size = Pt(11)
-        if chart.value_axis:
-            chart.value_axis.tick_labels.font.size = Pt(11)
-
-        avg_points = sum(points_series) / len(points_series) if points_series else None
+        # One pass over the history (oldest -> newest) builds both series and the points total
+        categories, points_series, hours_series = [], [], []
+        total_points = 0.0
+        for entry in reversed(velocity_history):
+            points = entry.get("points") or 0.0
+            categories.append(entry.get("name") or "Sprint")
+            points_series.append(points)
+            hours_series.append(round((entry.get("time_seconds") or 0) / 3600.0, 1))
+            total_points += points
+
+        # A trend line needs at least two sprints; with one, the average text below says it all
+        if len(points_series) >= 2:
+            chart_data = CategoryChartData()
+            chart_data.categories = categories
+            chart_data.add_series("Completed Points", points_series)
+            chart_data.add_series("Logged Hours", hours_series)
+
+            chart = slide.shapes.add_chart(
+                XL_CHART_TYPE.LINE_MARKERS,
+                Inches(0.5),
+                Inches(1.4),
+                Inches(9),
+                Inches(4.3),
+                chart_data,
+            ).chart
+            chart.has_legend = True
+            for axis in (chart.category_axis, chart.value_axis):
+                if axis:
+                    axis.tick_labels.font.size = AXIS_FONT_SIZE
+
+        avg_points = total_points / len(points_series)
         textbox = slide.shapes.add_textbox(Inches(0.5), Inches(5.9), Inches(9), Inches(1.2))
         tf = textbox.text_frame
-        tf.text = f"Average completed points: {avg_points:.1f}" if avg_points is not None else "Average completed points: n/a"
+        tf.text = f"Average completed points: {avg_points:.1f}"
 
-    thanks_layout = get_layout_by_name(prs, "thanks")
+    thanks_layout = _get_layout_by_name(layouts, prs, "thanks")
     prs.slides.add_slide(thanks_layout)
 
-    prs.save(filename)
+    if stream is not None:
+        prs.save(stream)
+        return
+    _save_presentation(prs, filename)
     print(f"Presentation saved as {filename}")
@@ -1,12 +1,15 @@
 """Shared pytest fixtures for Jira testing."""
 import pytest
 import os
+import sys
 from pathlib import Path
 
-@pytest.fixture
-def mock_jira_env(tmp_path, monkeypatch):
-    """Create a temporary .jira_environment file for testing."""
-    env_file = tmp_path / ".jira_environment"
+import jira_config
+
+@pytest.fixture(scope="session")
+def jira_env_file(tmp_path_factory):
+    """Write the test .jira_environment file once per test session."""
+    env_file = tmp_path_factory.mktemp("jira") / ".jira_environment"
     env_file.write_text("""
 export JT_JIRA_URL="https://test.atlassian.net"
 export JT_JIRA_USERNAME="test@example.com"
@@ -16,26 +19,45 @@ export JT_JIRA_FIELD_STORY_POINTS="customfield_10024"
 export JT_JIRA_FIELD_EPIC_LINK="customfield_10031"
 export JT_JIRA_FIELD_ACCEPTANCE_CRITERIA="customfield_10140"
 """)
+    return env_file
 
-    # Point jira_config to use this test file
-    import jira_config
-    monkeypatch.setattr(jira_config, "DEFAULT_ENV_PATH", env_file)
+@pytest.fixture
+def mock_jira_env(jira_env_file, monkeypatch):
+    """Point jira_config at the shared test .jira_environment file."""
+    monkeypatch.setattr(jira_config, "DEFAULT_ENV_PATH", jira_env_file)
+    return jira_env_file
 
-    # Clear cache to force reload with test config
-    jira_config.load_jira_env.cache_clear()
-    jira_config.get_jira_session.cache_clear()
+# Project modules whose functools.lru_cache results must not leak between tests
+_CACHED_MODULES = ("jira_config", "jira_performance", "jira_async", "jira_security", "jpt", "jpt_presentation")
+
+
+# Plain dict caches the attribute sniffing below can't find: (module, attribute)
+_DICT_CACHES = (("jira_config", "_SSL_VERIFY_BY_VALUE"),)
 
-    return env_file
+
+def _clear_lru_caches():
+    for name, attr in _DICT_CACHES:
+        module = sys.modules.get(name)
+        if module is not None:
+            getattr(module, attr).clear()
+    for name in _CACHED_MODULES:
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for obj in vars(module).values():
+            if hasattr(obj, "cache_clear") and hasattr(obj, "cache_info"):
+                obj.cache_clear()
 
 @pytest.fixture(autouse=True)
-def reset_session_cache():
-    """Reset session cache between tests to ensure isolation."""
-    import jira_config
-    if hasattr(jira_config, 'get_jira_session'):
-        jira_config.get_jira_session.cache_clear()
+def bust_lru_caches():
+    """Clear every lru_cache in the loaded project modules before and after each test.
+
+    Caches are found by attribute sniffing (as pytest-antilru does), so a newly
+    memoized function is covered without touching this fixture.
+    """
+    _clear_lru_caches()
     yield
-    if hasattr(jira_config, 'get_jira_session'):
-        jira_config.get_jira_session.cache_clear()
+    _clear_lru_caches()
 
 @pytest.fixture
 def mock_responses():
@@ -43,3 +65,15 @@ def mock_responses():
     import responses as resp_lib
     with resp_lib.RequestsMock() as rsps:
         yield rsps
+
+@pytest.fixture(scope="module")
+def _module_responses():
+    import responses as resp_lib
+    with resp_lib.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+@pytest.fixture
+def rsps(_module_responses):
+    """A responses mock started once per test module; stubs and calls are reset after each test."""
+    yield _module_responses
+    _module_responses.reset()
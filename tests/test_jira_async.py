@@ -2,8 +2,16 @@
 Tests for jira_async module - concurrent epic and issue fetching.
 """
 
+import asyncio
+import re
+
+import aiohttp
 import pytest
 from unittest.mock import Mock, patch
+
+# aioresponses is a dev-only dependency: skip this module as a whole when it is missing
+pytest.importorskip("aioresponses", reason="async tests need aioresponses")
+from aioresponses import CallbackResult, aioresponses
 from jira_async import (
     fetch_epic_batch_async,
     fetch_epics_sync,
@@ -15,6 +23,26 @@ from jira_async import (
 # Mark all tests in this module as async
 pytestmark = pytest.mark.asyncio
 
+JIRA_BASE_URL = "https://jira.example.com"
+AUTH = ("user@example.com", "token")
+# URL-encoded default field list jira_async requests for each issue
+FIELDS_QS = "summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus"
+
+
+def issue_url(key, fields=FIELDS_QS):
+    """Single-issue URL as jira_async requests it."""
+    return f"{JIRA_BASE_URL}/rest/api/3/issue/{key}?fields={fields}"
+
+# Any single-issue GET on the test Jira; the key is the last path segment
+ISSUE_URL_RE = re.compile(re.escape(JIRA_BASE_URL) + r"/rest/api/3/issue/[^/?]+(\?.*)?$")
+
+
+@pytest.fixture
+def mock_aiohttp():
+    """Intercept aiohttp requests for one test (imported once, not inside every test)."""
+    with aioresponses() as mocked:
+        yield mocked
+
 
 class TestFetchEpicBatchAsync:
     """Test async epic batch fetching."""
@@ -22,182 +50,102 @@ class TestFetchEpicBatchAsync:
     async def test_empty_epic_list(self):
         """Empty list should return empty dict."""
         result = await fetch_epic_batch_async(
-            "https://jira.example.com",
+            JIRA_BASE_URL,
             [],
-            ("user@example.com", "token"),
+            AUTH,
             True
         )
         assert result == {}
 
     @pytest.mark.asyncio
-    async def test_fetch_single_epic_success(self):
-        """Test fetching a single epic successfully."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            # Mock the Jira API response
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-123?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=200,
-                payload={
-                    "key": "PROJ-123",
-                    "fields": {
-                        "summary": "Epic Title",
-                        "labels": ["NLMS"],
-                        "status": {"name": "In Progress"}
-                    }
-                }
-            )
-
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                ["PROJ-123"],
-                ("user@example.com", "token"),
-                True
-            )
-
-            assert "PROJ-123" in result
-            assert result["PROJ-123"] is not None
-            assert result["PROJ-123"]["key"] == "PROJ-123"
-            assert result["PROJ-123"]["fields"]["summary"] == "Epic Title"
-
-    @pytest.mark.asyncio
-    async def test_fetch_multiple_epics_concurrently(self):
-        """Test fetching multiple epics in parallel."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            # Mock responses for 3 epics
-            for i in range(1, 4):
-                mock_aiohttp.get(
-                    f"https://jira.example.com/rest/api/3/issue/PROJ-{i}?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                    status=200,
-                    payload={
-                        "key": f"PROJ-{i}",
-                        "fields": {
-                            "summary": f"Epic {i}",
-                            "labels": ["NLMS"]
-                        }
-                    }
-                )
-
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                ["PROJ-1", "PROJ-2", "PROJ-3"],
-                ("user@example.com", "token"),
-                True
-            )
-
-            # All 3 should be fetched
-            assert len(result) == 3
-            assert all(key in result for key in ["PROJ-1", "PROJ-2", "PROJ-3"])
-
-            # Verify content
-            assert result["PROJ-1"]["fields"]["summary"] == "Epic 1"
-            assert result["PROJ-2"]["fields"]["summary"] == "Epic 2"
-            assert result["PROJ-3"]["fields"]["summary"] == "Epic 3"
+    @pytest.mark.parametrize("responses", [
+        {"PROJ-123": (200, {"summary": "Epic Title", "labels": ["NLMS"], "status": {"name": "In Progress"}})},
+        {f"PROJ-{i}": (200, {"summary": f"Epic {i}", "labels": ["NLMS"]}) for i in range(1, 4)},
+        {"PROJ-1": (200, {"summary": "Valid Epic"}), "PROJ-999": (404, None)},
+    ], ids=["single", "multiple-concurrent", "404-failure"])
+    async def test_fetch_epics(self, mock_aiohttp, responses):
+        """Each epic maps to its issue JSON, or to None when Jira answers with an error."""
+        expected = {
+            key: {"key": key, "fields": fields} if status == 200 else None
+            for key, (status, fields) in responses.items()
+        }
+        for key, (status, _) in responses.items():
+            mock_aiohttp.get(issue_url(key), status=status, payload=expected[key])
+
+        result = await fetch_epic_batch_async(JIRA_BASE_URL, list(responses), AUTH, True)
+
+        assert result == expected
 
     @pytest.mark.asyncio
-    async def test_fetch_with_404_failure(self):
-        """Test handling of 404 (not found) errors."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            # First epic succeeds
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-1?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=200,
-                payload={
-                    "key": "PROJ-1",
-                    "fields": {"summary": "Valid Epic"}
-                }
-            )
-
-            # Second epic fails with 404
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-999?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=404
-            )
+    async def test_reuses_injected_session(self, mock_aiohttp):
+        """A caller-supplied session is used for the requests and left open afterwards."""
+        mock_aiohttp.get(issue_url("PROJ-1"), status=200, payload={"key": "PROJ-1", "fields": {"summary": "Shared"}})
 
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                ["PROJ-1", "PROJ-999"],
-                ("user@example.com", "token"),
-                True
-            )
+        async with aiohttp.ClientSession() as session:
+            result = await fetch_epic_batch_async(JIRA_BASE_URL, ["PROJ-1"], AUTH, True, session=session)
+            assert not session.closed
 
-            # First epic should succeed
-            assert result["PROJ-1"] is not None
-            assert result["PROJ-1"]["fields"]["summary"] == "Valid Epic"
-
-            # Second epic should be None (failed)
-            assert result["PROJ-999"] is None
+        assert result["PROJ-1"]["fields"]["summary"] == "Shared"
 
     @pytest.mark.asyncio
-    async def test_fetch_with_server_error_retry(self):
+    async def test_fetch_with_server_error_retry(self, mock_aiohttp):
         """Test retry logic for 5xx server errors."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            # First two calls fail with 500, third succeeds
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-1?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=500
-            )
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-1?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=500
-            )
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-1?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=200,
-                payload={
-                    "key": "PROJ-1",
-                    "fields": {"summary": "Recovered Epic"}
-                }
-            )
+        # First two calls fail with 500, third succeeds
+        mock_aiohttp.get(
+            issue_url("PROJ-1"),
+            status=500
+        )
+        mock_aiohttp.get(
+            issue_url("PROJ-1"),
+            status=500
+        )
+        mock_aiohttp.get(
+            issue_url("PROJ-1"),
+            status=200,
+            payload={
+                "key": "PROJ-1",
+                "fields": {"summary": "Recovered Epic"}
+            }
+        )
 
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                ["PROJ-1"],
-                ("user@example.com", "token"),
-                True
-            )
+        result = await fetch_epic_batch_async(
+            JIRA_BASE_URL,
+            ["PROJ-1"],
+            AUTH,
+            True
+        )
 
-            # Should succeed after retries
-            assert result["PROJ-1"] is not None
-            assert result["PROJ-1"]["fields"]["summary"] == "Recovered Epic"
+        # Should succeed after retries
+        assert result["PROJ-1"] is not None
+        assert result["PROJ-1"]["fields"]["summary"] == "Recovered Epic"
 
     @pytest.mark.asyncio
-    async def test_custom_fields_parameter(self):
+    async def test_custom_fields_parameter(self, mock_aiohttp):
         """Test fetching with custom field list."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            # Note: aioresponses will match the exact URL with fields
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-1?fields=summary%2Cdescription",
-                status=200,
-                payload={
-                    "key": "PROJ-1",
-                    "fields": {
-                        "summary": "Epic with custom fields",
-                        "description": "Description text"
-                    }
+        # Note: aioresponses will match the exact URL with fields
+        mock_aiohttp.get(
+            issue_url("PROJ-1", "summary%2Cdescription"),
+            status=200,
+            payload={
+                "key": "PROJ-1",
+                "fields": {
+                    "summary": "Epic with custom fields",
+                    "description": "Description text"
                 }
-            )
+            }
+        )
 
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                ["PROJ-1"],
-                ("user@example.com", "token"),
-                True,
-                fields=["summary", "description"]
-            )
+        result = await fetch_epic_batch_async(
+            JIRA_BASE_URL,
+            ["PROJ-1"],
+            AUTH,
+            True,
+            fields=["summary", "description"]
+        )
 
-            assert result["PROJ-1"] is not None
-            assert result["PROJ-1"]["fields"]["summary"] == "Epic with custom fields"
-            assert result["PROJ-1"]["fields"]["description"] == "Description text"
+        assert result["PROJ-1"] is not None
+        assert result["PROJ-1"]["fields"]["summary"] == "Epic with custom fields"
+        assert result["PROJ-1"]["fields"]["description"] == "Description text"
 
 
 class TestFetchEpicsSync:
@@ -206,9 +154,9 @@ class TestFetchEpicsSync:
     def test_sync_wrapper_empty_list(self):
         """Sync wrapper with empty list should return empty dict."""
         result = fetch_epics_sync(
-            "https://jira.example.com",
+            JIRA_BASE_URL,
             [],
-            ("user@example.com", "token"),
+            AUTH,
             True
         )
         assert result == {}
@@ -220,9 +168,9 @@ class TestFetchEpicsSync:
         # In practice, the sync wrapper works correctly (as verified by integration tests).
 
         result = fetch_epics_sync(
-            "https://jira.example.com",
+            JIRA_BASE_URL,
             [],
-            ("user@example.com", "token"),
+            AUTH,
             True
         )
 
@@ -234,46 +182,43 @@ class TestFetchIssuesBatchAsync:
     """Test generic issue batch fetching (works for any issue type)."""
 
     @pytest.mark.asyncio
-    async def test_fetch_mixed_issue_types(self):
+    async def test_fetch_mixed_issue_types(self, mock_aiohttp):
         """Test fetching stories, tasks, bugs together."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            # Mock different issue types
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/STORY-1?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=200,
-                payload={
-                    "key": "STORY-1",
-                    "fields": {
-                        "summary": "User Story",
-                        "issuetype": {"name": "Story"}
-                    }
+        # Mock different issue types
+        mock_aiohttp.get(
+            issue_url("STORY-1"),
+            status=200,
+            payload={
+                "key": "STORY-1",
+                "fields": {
+                    "summary": "User Story",
+                    "issuetype": {"name": "Story"}
                 }
-            )
-
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/BUG-2?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=200,
-                payload={
-                    "key": "BUG-2",
-                    "fields": {
-                        "summary": "Bug Report",
-                        "issuetype": {"name": "Bug"}
-                    }
+            }
+        )
+
+        mock_aiohttp.get(
+            issue_url("BUG-2"),
+            status=200,
+            payload={
+                "key": "BUG-2",
+                "fields": {
+                    "summary": "Bug Report",
+                    "issuetype": {"name": "Bug"}
                 }
-            )
+            }
+        )
 
-            result = await fetch_issues_batch_async(
-                "https://jira.example.com",
-                ["STORY-1", "BUG-2"],
-                ("user@example.com", "token"),
-                True
-            )
+        result = await fetch_issues_batch_async(
+            JIRA_BASE_URL,
+            ["STORY-1", "BUG-2"],
+            AUTH,
+            True
+        )
 
-            assert len(result) == 2
-            assert result["STORY-1"]["fields"]["summary"] == "User Story"
-            assert result["BUG-2"]["fields"]["summary"] == "Bug Report"
+        assert len(result) == 2
+        assert result["STORY-1"]["fields"]["summary"] == "User Story"
+        assert result["BUG-2"]["fields"]["summary"] == "Bug Report"
 
 
 class TestFetchIssuesSync:
@@ -282,9 +227,9 @@ class TestFetchIssuesSync:
     def test_sync_wrapper_generic_issues(self):
         """Sync wrapper should work for any issue type."""
         result = fetch_issues_sync(
-            "https://jira.example.com",
+            JIRA_BASE_URL,
             [],
-            ("user@example.com", "token"),
+            AUTH,
             True
         )
         assert result == {}
@@ -294,69 +239,53 @@ class TestConcurrencyControl:
     """Test max_concurrent parameter controls parallelism."""
 
     @pytest.mark.asyncio
-    async def test_respects_max_concurrent_limit(self):
-        """Verify that max_concurrent parameter is passed correctly."""
-        from aioresponses import aioresponses
-
-        # Note: Testing actual concurrency limits is difficult with mocks.
-        # This test verifies basic functionality with concurrent requests.
-
-        with aioresponses() as mock_aiohttp:
-            # Mock 10 epics
-            for i in range(1, 11):
-                mock_aiohttp.get(
-                    f"https://jira.example.com/rest/api/3/issue/PROJ-{i}?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                    status=200,
-                    payload={
-                        "key": f"PROJ-{i}",
-                        "fields": {"summary": f"Epic {i}"}
-                    }
-                )
-
-            epic_keys = [f"PROJ-{i}" for i in range(1, 11)]
-
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                epic_keys,
-                ("user@example.com", "token"),
-                True,
-                max_concurrent=5  # Limit to 5 concurrent
-            )
-
-            # All 10 should be fetched successfully
-            assert len(result) == 10
-            # Verify all results are present
-            for i in range(1, 11):
-                assert result[f"PROJ-{i}"] is not None
-                assert result[f"PROJ-{i}"]["fields"]["summary"] == f"Epic {i}"
+    async def test_respects_max_concurrent_limit(self, mock_aiohttp):
+        """No more than max_concurrent requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def reply(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Hold the request open so the other fetches pile up behind the semaphore
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            key = url.path.rsplit("/", 1)[-1]
+            return CallbackResult(status=200, payload={"key": key, "fields": {"summary": f"Epic {key}"}})
+
+        mock_aiohttp.get(ISSUE_URL_RE, callback=reply, repeat=True)
+        epic_keys = [f"PROJ-{i}" for i in range(1, 11)]
+
+        result = await fetch_epic_batch_async(JIRA_BASE_URL, epic_keys, AUTH, True, max_concurrent=5)
+
+        assert peak == 5
+        assert result == {key: {"key": key, "fields": {"summary": f"Epic {key}"}} for key in epic_keys}
 
 
 class TestSSLConfiguration:
     """Test SSL verification configuration."""
 
     @pytest.mark.asyncio
-    async def test_ssl_true_default_behavior(self):
+    async def test_ssl_true_default_behavior(self, mock_aiohttp):
         """SSL verification enabled should use default context."""
-        from aioresponses import aioresponses
-
-        with aioresponses() as mock_aiohttp:
-            mock_aiohttp.get(
-                "https://jira.example.com/rest/api/3/issue/PROJ-1?fields=summary%2Cparent%2Cissuelinks%2Clabels%2Cstatus",
-                status=200,
-                payload={
-                    "key": "PROJ-1",
-                    "fields": {"summary": "SSL Test"}
-                }
-            )
+        mock_aiohttp.get(
+            issue_url("PROJ-1"),
+            status=200,
+            payload={
+                "key": "PROJ-1",
+                "fields": {"summary": "SSL Test"}
+            }
+        )
 
-            result = await fetch_epic_batch_async(
-                "https://jira.example.com",
-                ["PROJ-1"],
-                ("user@example.com", "token"),
-                True  # SSL verification enabled
-            )
+        result = await fetch_epic_batch_async(
+            JIRA_BASE_URL,
+            ["PROJ-1"],
+            AUTH,
+            True  # SSL verification enabled
+        )
 
-            assert result["PROJ-1"] is not None
+        assert result["PROJ-1"] is not None
 
     @pytest.mark.asyncio
     async def test_ssl_custom_cert_path(self):
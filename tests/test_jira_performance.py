@@ -2,18 +2,44 @@
 Tests for jira_performance module - caching and optimized date parsing.
 """
 
+import json
+from concurrent.futures import Future
+
 import pytest
 from datetime import datetime, timezone
+import jira_performance
 from unittest.mock import Mock, patch
 from jira_performance import (
     parse_iso8601_datetime,
     get_cached_sprint_metadata,
     clear_sprint_cache,
     clear_date_parse_cache,
-    get_cache_stats
+    get_cache_stats,
+    cached_get_json,
+    enable_response_cache,
+    disable_response_cache,
+    clear_response_cache,
+    decode_json_response,
+    json_loads,
+    load_cached_entries,
+    store_cached_entries,
 )
 
 
+class _Resp:
+    """Minimal stand-in for a requests.Response with a JSON body (cheaper than a Mock)."""
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
 class TestParseISO8601Datetime:
     """Test ISO 8601 date parsing with various formats."""
 
@@ -21,49 +47,26 @@ class TestParseISO8601Datetime:
         """Clear cache before each test."""
         clear_date_parse_cache()
 
-    def test_parse_z_format(self):
-        """Parse dates with Z (Zulu/UTC) timezone."""
-        dt = parse_iso8601_datetime("2024-01-15T09:00:00.000Z")
+    @pytest.mark.parametrize("iso_string, expected", [
+        # Z (Zulu/UTC) timezone
+        ("2024-01-15T09:00:00.000Z", {"year": 2024, "month": 1, "day": 15, "hour": 9, "minute": 0}),
+        # +0000 timezone offset
+        ("2024-01-15T09:00:00.000+0000", {"year": 2024, "month": 1, "day": 15}),
+        # +HH:MM timezone offset
+        ("2024-01-15T09:00:00+02:00", {"year": 2024, "month": 1, "day": 15, "hour": 9}),
+        # microseconds
+        ("2024-01-15T09:00:00.123456Z", {"microsecond": 123456}),
+    ], ids=["z", "plus-0000", "plus-hh-mm", "microseconds"])
+    def test_parse_formats(self, iso_string, expected):
+        """Supported Jira datetime formats parse to the expected fields."""
+        dt = parse_iso8601_datetime(iso_string)
         assert dt is not None
-        assert dt.year == 2024
-        assert dt.month == 1
-        assert dt.day == 15
-        assert dt.hour == 9
-        assert dt.minute == 0
-
-    def test_parse_plus_0000_format(self):
-        """Parse dates with +0000 timezone offset."""
-        dt = parse_iso8601_datetime("2024-01-15T09:00:00.000+0000")
-        assert dt is not None
-        assert dt.year == 2024
-        assert dt.month == 1
-        assert dt.day == 15
+        assert {attr: getattr(dt, attr) for attr in expected} == expected
 
-    def test_parse_plus_hhmm_format(self):
-        """Parse dates with +HH:MM timezone offset."""
-        dt = parse_iso8601_datetime("2024-01-15T09:00:00+02:00")
-        assert dt is not None
-        assert dt.year == 2024
-        assert dt.month == 1
-        assert dt.day == 15
-        assert dt.hour == 9
-
-    def test_parse_with_microseconds(self):
-        """Parse dates with microseconds."""
-        dt = parse_iso8601_datetime("2024-01-15T09:00:00.123456Z")
-        assert dt is not None
-        assert dt.microsecond == 123456
-
-    def test_parse_empty_string(self):
-        """Empty strings should return None."""
-        assert parse_iso8601_datetime("") is None
-        assert parse_iso8601_datetime(None) is None
-
-    def test_parse_invalid_format(self):
-        """Invalid date formats should return None."""
-        assert parse_iso8601_datetime("invalid") is None
-        assert parse_iso8601_datetime("2024-13-45") is None
-        assert parse_iso8601_datetime("not-a-date") is None
+    @pytest.mark.parametrize("iso_string", ["", None, "invalid", "2024-13-45", "not-a-date"])
+    def test_parse_empty_or_invalid(self, iso_string):
+        """Empty and invalid inputs return None."""
+        assert parse_iso8601_datetime(iso_string) is None
 
     def test_caching_works(self):
         """Verify that repeated calls use cached results."""
@@ -108,14 +111,13 @@ class TestCachedSprintMetadata:
         """Test basic sprint metadata fetching."""
         # Mock session and response
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _Resp({
             "id": 123,
             "name": "Sprint 42",
             "startDate": "2024-01-15T09:00:00.000Z",
             "endDate": "2024-01-29T18:00:00.000Z",
             "state": "active"
-        }
+        })
         mock_session.get.return_value = mock_response
         mock_get_session.return_value = mock_session
 
@@ -139,13 +141,12 @@ class TestCachedSprintMetadata:
         """Verify that caching prevents duplicate API calls."""
         # Mock session
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _Resp({
             "id": 456,
             "name": "Sprint 99",
             "startDate": "2024-02-01T09:00:00.000Z",
             "endDate": "2024-02-15T18:00:00.000Z",
-        }
+        })
         mock_session.get.return_value = mock_response
         mock_get_session.return_value = mock_session
 
@@ -176,12 +177,11 @@ class TestCachedSprintMetadata:
 
         def mock_get(url, **kwargs):
             """Return different data based on sprint ID in URL."""
-            response = Mock()
             if "sprint/100" in url:
-                response.json.return_value = {"id": 100, "name": "Sprint 100"}
-            elif "sprint/200" in url:
-                response.json.return_value = {"id": 200, "name": "Sprint 200"}
-            return response
+                return _Resp({"id": 100, "name": "Sprint 100"})
+            if "sprint/200" in url:
+                return _Resp({"id": 200, "name": "Sprint 200"})
+            return _Resp({})
 
         mock_session.get.side_effect = mock_get
         mock_get_session.return_value = mock_session
@@ -203,8 +203,7 @@ class TestCachedSprintMetadata:
     def test_cache_clear_works(self, mock_get_session):
         """Clearing cache should force re-fetch."""
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"id": 789, "name": "Sprint Test"}
+        mock_response = _Resp({"id": 789, "name": "Sprint Test"})
         mock_session.get.return_value = mock_response
         mock_get_session.return_value = mock_session
 
@@ -261,3 +260,137 @@ class TestCacheStats:
         # Should have 1 more miss and 1 more hit
         assert stats_after['date_cache'].misses == initial_misses + 1
         assert stats_after['date_cache'].hits >= stats_before['date_cache'].hits + 1
+
+
+class TestResponseCache:
+    """Test the persistent on-disk response cache."""
+
+    def teardown_method(self):
+        """Never leave the cache enabled for other tests."""
+        disable_response_cache()
+
+    def _mock_session(self, payload):
+        mock_session = Mock()
+        mock_session.get.return_value = _Resp(payload)
+        return mock_session
+
+    def test_disabled_cache_always_fetches(self):
+        """Without enable_response_cache() every call hits the session."""
+        mock_session = self._mock_session({"total": 0, "issues": []})
+
+        cached_get_json(mock_session, "https://jira.example.com/rest/agile/1.0/sprint/1/issue")
+        cached_get_json(mock_session, "https://jira.example.com/rest/agile/1.0/sprint/1/issue")
+
+        assert mock_session.get.call_count == 2
+
+    def test_enabled_cache_reuses_response(self, tmp_path):
+        """A fresh cache entry is served from disk without a second request."""
+        enable_response_cache(tmp_path)
+        mock_session = self._mock_session({"total": 1, "issues": [{"key": "PROJ-1"}]})
+        url = "https://jira.example.com/rest/agile/1.0/sprint/1/issue"
+
+        first = cached_get_json(mock_session, url, params={"startAt": 0})
+        second = cached_get_json(mock_session, url, params={"startAt": 0})
+
+        assert first == second == {"total": 1, "issues": [{"key": "PROJ-1"}]}
+        assert mock_session.get.call_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_cache_keyed_by_params(self, tmp_path):
+        """Different params are cached separately."""
+        enable_response_cache(tmp_path)
+        mock_session = self._mock_session({"issues": []})
+        url = "https://jira.example.com/rest/agile/1.0/sprint/1/issue"
+
+        cached_get_json(mock_session, url, params={"startAt": 0})
+        cached_get_json(mock_session, url, params={"startAt": 50})
+
+        assert mock_session.get.call_count == 2
+
+    def test_expired_entry_is_refetched(self, tmp_path):
+        """Entries older than the TTL are fetched again."""
+        enable_response_cache(tmp_path, ttl=0)
+        mock_session = self._mock_session({"issues": []})
+        url = "https://jira.example.com/rest/agile/1.0/sprint/1/issue"
+
+        cached_get_json(mock_session, url)
+        cached_get_json(mock_session, url)
+
+        assert mock_session.get.call_count == 2
+
+    def test_clear_response_cache(self, tmp_path):
+        """Clearing removes cached entries so the next call refetches."""
+        enable_response_cache(tmp_path)
+        mock_session = self._mock_session({"issues": []})
+        url = "https://jira.example.com/rest/agile/1.0/sprint/1/issue"
+
+        cached_get_json(mock_session, url)
+        clear_response_cache()
+        cached_get_json(mock_session, url)
+
+        assert mock_session.get.call_count == 2
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_cached_entries_round_trip(self, tmp_path):
+        """Stored entries are returned until they are older than the TTL."""
+        enable_response_cache(tmp_path)
+        store_cached_entries("epic_parents", {"PROJ-1": {"parent": "EMSS-7"}})
+        store_cached_entries("epic_parents", {"PROJ-2": {"parent": "EMSS-8"}})
+
+        assert load_cached_entries("epic_parents", ttl=60) == {
+            "PROJ-1": {"parent": "EMSS-7"},
+            "PROJ-2": {"parent": "EMSS-8"},
+        }
+        assert load_cached_entries("epic_parents", ttl=0) == {}
+
+    def test_cached_entries_need_enabled_cache(self):
+        """Without enable_response_cache() nothing is stored or loaded."""
+        store_cached_entries("epic_parents", {"PROJ-1": {"parent": "EMSS-7"}})
+        assert load_cached_entries("epic_parents", ttl=60) == {}
+
+
+class TestInflightCoalescing:
+    """Test that concurrent identical requests share one HTTP call."""
+
+    def test_waits_for_request_in_flight(self):
+        """A caller for a URL already on the wire gets that request's result."""
+
+        url = "https://jira.example.com/rest/agile/1.0/sprint/1/issue"
+        params = {"startAt": 0}
+        pending = Future()
+        pending.set_result({"total": 0, "issues": []})
+        key = jira_performance._response_cache_key(url, params)
+        jira_performance._INFLIGHT[key] = pending
+        mock_session = Mock()
+        try:
+            assert cached_get_json(mock_session, url, params) == {"total": 0, "issues": []}
+        finally:
+            jira_performance._INFLIGHT.pop(key, None)
+
+        mock_session.get.assert_not_called()
+
+    def test_inflight_entry_removed_after_request(self):
+        """Finished requests (including failures) don't linger in the in-flight table."""
+
+        mock_session = Mock()
+        mock_session.get.return_value.raise_for_status.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cached_get_json(mock_session, "https://jira.example.com/rest/agile/1.0/sprint/2/issue")
+
+        assert jira_performance._INFLIGHT == {}
+
+
+class TestJsonDecoding:
+    """Test the orjson-or-stdlib JSON helpers."""
+
+    def test_json_loads_accepts_text_and_bytes(self):
+        """Both str and bytes bodies decode to the same structure."""
+        assert json_loads('{"total": 1}') == json_loads(b'{"total": 1}') == {"total": 1}
+
+    def test_decode_json_response_matches_resp_json(self):
+        """Decoding the body gives the same result as requests' resp.json()."""
+        payload = {"issues": [{"key": "PROJ-1", "fields": {"summary": "Caf\u00e9"}}]}
+        mock_response = _Resp(payload)
+
+        assert decode_json_response(mock_response) == payload
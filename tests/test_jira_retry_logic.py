@@ -1,111 +1,126 @@
 """Test retry behavior for various failure scenarios."""
+import json
+
 import pytest
 import responses
+from urllib3.util.retry import Retry
+import jira_config
 from jira_config import get_jira_session
 
+@pytest.fixture(scope="module")
+def jira_session(jira_env_file):
+    """One Jira session (adapter and Retry policy) shared by the tests in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(jira_config, "DEFAULT_ENV_PATH", jira_env_file)
+        return get_jira_session()
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(monkeypatch):
+    """Skip urllib3's backoff and Retry-After waits; these tests only check the retry counts."""
+    monkeypatch.setattr(Retry, "sleep", lambda self, response=None: None)
+
+def add_sequence(method, url, *replies):
+    """Answer successive requests to ``url`` from ``replies`` with one registered callback.
+
+    Each reply is ``(status, json_body)`` or ``(status, json_body, headers)``;
+    a ``None`` body sends an empty response.
+    """
+    pending = iter(replies)
+
+    def reply(request):
+        status, body, *headers = next(pending)
+        return status, dict(*headers), "" if body is None else json.dumps(body)
+
+    responses.add_callback(method, url, callback=reply, content_type="application/json")
+
 @responses.activate
-def test_retry_on_500_error(mock_jira_env):
+def test_retry_on_500_error(jira_session):
     """Verify retries occur on 500 Internal Server Error."""
     url = "https://test.atlassian.net/rest/api/3/issue/TEST-1"
 
     # First 2 attempts fail with 500, 3rd succeeds
-    responses.add(responses.GET, url, status=500, json={"error": "Server Error"})
-    responses.add(responses.GET, url, status=500, json={"error": "Server Error"})
-    responses.add(responses.GET, url, status=200, json={"key": "TEST-1", "fields": {}})
+    add_sequence(responses.GET, url, (500, None), (500, None), (200, {"key": "TEST-1", "fields": {}}))
 
-    session = get_jira_session()
-    resp = session.get(url, timeout=15)
+    resp = jira_session.get(url, timeout=15)
 
     assert resp.status_code == 200
     assert len(responses.calls) == 3, "Should retry twice before success"
 
 @responses.activate
-def test_retry_on_503_error(mock_jira_env):
+def test_retry_on_503_error(jira_session):
     """Verify retries occur on 503 Service Unavailable."""
     url = "https://test.atlassian.net/rest/api/3/issue/TEST-2"
-    responses.add(responses.GET, url, status=503)
-    responses.add(responses.GET, url, status=200, json={"key": "TEST-2"})
+    add_sequence(responses.GET, url, (503, None), (200, {"key": "TEST-2"}))
 
-    session = get_jira_session()
-    resp = session.get(url, timeout=15)
+    resp = jira_session.get(url, timeout=15)
 
     assert resp.status_code == 200
     assert len(responses.calls) == 2
 
 @responses.activate
-def test_retry_on_429_rate_limit(mock_jira_env):
+def test_retry_on_429_rate_limit(jira_session):
     """Verify retries occur on 429 rate limit with exponential backoff."""
     url = "https://test.atlassian.net/rest/api/3/issue/TEST-3"
-    responses.add(responses.GET, url, status=429, headers={"Retry-After": "1"})
-    responses.add(responses.GET, url, status=200, json={"key": "TEST-3"})
+    add_sequence(responses.GET, url, (429, None, {"Retry-After": "1"}), (200, {"key": "TEST-3"}))
 
-    session = get_jira_session()
-    resp = session.get(url, timeout=15)
+    resp = jira_session.get(url, timeout=15)
 
     assert resp.status_code == 200
     assert len(responses.calls) == 2
 
 @responses.activate
-def test_no_retry_on_404(mock_jira_env):
+def test_no_retry_on_404(jira_session):
     """Verify no retries on 404 Not Found (client error)."""
     url = "https://test.atlassian.net/rest/api/3/issue/NONEXISTENT"
     responses.add(responses.GET, url, status=404, json={"error": "Not Found"})
 
-    session = get_jira_session()
-    resp = session.get(url, timeout=15)
+    resp = jira_session.get(url, timeout=15)
 
     assert resp.status_code == 404
     assert len(responses.calls) == 1, "Should not retry on client errors"
 
 @responses.activate
-def test_no_retry_on_401(mock_jira_env):
+def test_no_retry_on_401(jira_session):
     """Verify no retries on 401 Unauthorized (client error)."""
     url = "https://test.atlassian.net/rest/api/3/issue/TEST-4"
     responses.add(responses.GET, url, status=401, json={"error": "Unauthorized"})
 
-    session = get_jira_session()
-    resp = session.get(url, timeout=15)
+    resp = jira_session.get(url, timeout=15)
 
     assert resp.status_code == 401
     assert len(responses.calls) == 1
 
 @responses.activate
-def test_retry_exhaustion(mock_jira_env):
+def test_retry_exhaustion(jira_session):
     """Verify behavior after all retries exhausted."""
     url = "https://test.atlassian.net/rest/api/3/issue/TEST-5"
 
     # Return 500 for all 5 attempts (initial + 4 retries)
-    for _ in range(5):
-        responses.add(responses.GET, url, status=500)
+    add_sequence(responses.GET, url, *[(500, None)] * 5)
 
-    session = get_jira_session()
-    resp = session.get(url, timeout=15)
+    resp = jira_session.get(url, timeout=15)
 
     assert resp.status_code == 500
     assert len(responses.calls) == 5, "Should exhaust all retries"
 
 @responses.activate
-def test_post_request_retry(mock_jira_env):
+def test_post_request_retry(jira_session):
     """Verify POST requests also retry on 5xx (new feature)."""
     url = "https://test.atlassian.net/rest/api/3/search"
-    responses.add(responses.POST, url, status=503)
-    responses.add(responses.POST, url, status=200, json={"issues": [], "total": 0})
+    add_sequence(responses.POST, url, (503, None), (200, {"issues": [], "total": 0}))
 
-    session = get_jira_session()
-    resp = session.post(url, json={"jql": "project=TEST"}, timeout=15)
+    resp = jira_session.post(url, json={"jql": "project=TEST"}, timeout=15)
 
     assert resp.status_code == 200
     assert len(responses.calls) == 2, "POST should also retry"
 
 @responses.activate
-def test_put_request_retry(mock_jira_env):
+def test_put_request_retry(jira_session):
     """Verify PUT requests also retry on 5xx (new feature)."""
     url = "https://test.atlassian.net/rest/api/3/issue/TEST-6"
-    responses.add(responses.PUT, url, status=502)
-    responses.add(responses.PUT, url, status=200, json={"key": "TEST-6"})
+    add_sequence(responses.PUT, url, (502, None), (200, {"key": "TEST-6"}))
 
-    session = get_jira_session()
-    resp = session.put(url, json={"fields": {"labels": ["test"]}}, timeout=15)
+    resp = jira_session.put(url, json={"fields": {"labels": ["test"]}}, timeout=15)
 
     assert resp.status_code == 200
     assert len(responses.calls) == 2, "PUT should also retry"
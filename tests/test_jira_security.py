@@ -8,6 +8,7 @@ from jira_security import (
     sanitize_jql_value,
     sanitize_jql_list,
     SensitiveDataFilter,
+    SafeStr,
     get_safe_jql_logger
 )
 
@@ -149,6 +150,40 @@ class TestSensitiveDataFilter:
         assert "abc123def456ghi789jkl012mno345pqr678" not in redacted
         assert "[REDACTED]" in redacted
 
+    def test_email_next_to_token_redacted(self):
+        """An email address glued to an API token is still redacted."""
+        filter_obj = SensitiveDataFilter()
+
+        redacted = filter_obj._redact("user@example.comATATTabc123.")
+
+        assert "user@" not in redacted
+        assert "[REDACTED-EMAIL]" in redacted
+
+    def test_text_without_sensitive_data_unchanged(self):
+        """Messages with nothing to redact are returned as-is."""
+        filter_obj = SensitiveDataFilter()
+
+        text = "Fetched 42 issues for PROJ-123 in sprint 7"
+        assert filter_obj._redact(text) is text
+
+    def test_sanitized_key_skips_redaction(self):
+        """Validated values are marked safe and pass the filter untouched."""
+        filter_obj = SensitiveDataFilter()
+
+        key = sanitize_jql_value("PROJ-123", "key")
+
+        assert isinstance(key, SafeStr)
+        assert filter_obj._redact(key) is key
+
+    def test_sanitized_token_like_label_still_redacted(self):
+        """A valid label that looks like a token is not marked safe."""
+        filter_obj = SensitiveDataFilter()
+
+        label = sanitize_jql_value("ATATTabc123", "label")
+
+        assert not isinstance(label, SafeStr)
+        assert filter_obj._redact(label) == "[REDACTED-TOKEN]"
+
     def test_log_record_filtering(self):
         """LogRecord messages should be filtered."""
         filter_obj = SensitiveDataFilter()
@@ -220,18 +255,18 @@ class TestGetSafeJQLLogger:
         filters = [f for f in logger2.filters if isinstance(f, SensitiveDataFilter)]
         assert len(filters) == 1
 
-    def test_logger_redacts_in_practice(self, caplog):
+    def test_logger_redacts_in_practice(self):
         """Logger should actually redact sensitive data when logging."""
         logger = get_safe_jql_logger("test_logger3")
-        logger.setLevel(logging.INFO)
 
-        with caplog.at_level(logging.INFO, logger="test_logger3"):
-            logger.info("API token: ATATT123456789abc")
+        record = logger.makeRecord(
+            "test_logger3", logging.INFO, "", 1, "API token: %s", ("ATATT123456789abc",), None
+        )
 
-        # Check log output
-        assert len(caplog.records) == 1
-        assert "ATATT123456789abc" not in caplog.text
-        assert "[REDACTED-TOKEN]" in caplog.text
+        # Run the logger's own filters, as Logger.handle() does before any handler sees the record
+        assert logger.filter(record)
+        assert "ATATT123456789abc" not in record.getMessage()
+        assert "[REDACTED-TOKEN]" in record.getMessage()
 
 
 class TestTextValueSanitization:
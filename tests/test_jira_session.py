@@ -1,5 +1,8 @@
 """Test session creation and configuration."""
+import os
+
 import pytest
+import jira_config
 from jira_config import get_jira_session, load_jira_env
 from requests import Session
 from requests.adapters import HTTPAdapter
@@ -10,6 +13,21 @@ def test_session_is_singleton(mock_jira_env):
     session2 = get_jira_session()
     assert session1 is session2, "Session should be singleton"
 
+def test_session_rebuilt_after_env_edit(tmp_path, monkeypatch):
+    """Verify new credentials in an edited .jira_environment reach the next session."""
+    env_file = tmp_path / ".jira_environment"
+    env_file.write_text("JT_JIRA_USERNAME=old@example.com\nJT_JIRA_PASSWORD=old-token\n")
+    monkeypatch.setattr(jira_config, "DEFAULT_ENV_PATH", env_file)
+    first = get_jira_session()
+
+    env_file.write_text("JT_JIRA_USERNAME=new@example.com\nJT_JIRA_PASSWORD=new-token\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = get_jira_session()
+
+    assert second is not first
+    assert second.auth == ("new@example.com", "new-token")
+
 def test_session_is_requests_session(mock_jira_env):
     """Verify returned object is a requests.Session."""
     session = get_jira_session()
@@ -38,7 +56,7 @@ def test_session_connection_pooling(mock_jira_env):
     session = get_jira_session()
     adapter = session.get_adapter("https://test.atlassian.net")
     assert adapter._pool_connections == 10
-    assert adapter._pool_maxsize == 20
+    assert adapter._pool_maxsize == 32
 
 def test_session_verify_ssl_default(mock_jira_env, monkeypatch):
     """Verify SSL verification defaults to True when not configured."""
@@ -47,8 +65,49 @@ def test_session_verify_ssl_default(mock_jira_env, monkeypatch):
     monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
 
     # Clear cache and recreate session
-    import jira_config
     jira_config.get_jira_session.cache_clear()
 
     session = get_jira_session()
     assert session.verify is True
+
+def test_session_requests_compressed_json(mock_jira_env):
+    """Verify session asks Jira for compressed JSON responses."""
+    session = get_jira_session()
+    assert session.headers["Accept"] == "application/json"
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+def test_setting_lookup_reuses_env_cache(mock_jira_env):
+    """Verify get_jira_setting shares the load_jira_env cache entry (file parsed once)."""
+    jira_config.load_jira_env()
+    assert jira_config.get_jira_setting("JT_JIRA_BOARD") == "42"
+    assert jira_config._parse_env_file.cache_info().currsize == 1
+
+def test_env_file_reparsed_after_edit(tmp_path):
+    """Verify an edited .jira_environment is picked up without clearing caches."""
+    env_file = tmp_path / ".jira_environment"
+    env_file.write_text("JT_JIRA_BOARD=42\n")
+    assert load_jira_env(env_file)["JT_JIRA_BOARD"] == "42"
+
+    env_file.write_text("JT_JIRA_BOARD=43\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_jira_env(env_file)["JT_JIRA_BOARD"] == "43"
+
+def test_env_file_parsing(tmp_path):
+    """Verify export prefixes, quotes, comments and blank lines are handled."""
+    env_file = tmp_path / ".jira_environment"
+    env_file.write_text(
+        "# comment line\n"
+        "\n"
+        "export JT_JIRA_URL=\"https://test.atlassian.net\"\n"
+        "  JT_JIRA_BOARD = '42'  \r\n"
+        "    # export JT_JIRA_PASSWORD=ignored\n"
+        "JT_JQL=project = X\n"
+        "not an assignment\n"
+    )
+    env = load_jira_env(env_file)
+    assert env == {
+        "JT_JIRA_URL": "https://test.atlassian.net",
+        "JT_JIRA_BOARD": "42",
+        "JT_JQL": "project = X",
+    }
@@ -1,6 +1,7 @@
 """Test SSL verification configuration modes."""
 import pytest
 from pathlib import Path
+import jira_config
 from jira_config import get_jira_session, get_ssl_verify
 
 def test_ssl_verify_true(mock_jira_env, monkeypatch):
@@ -8,7 +9,6 @@ def test_ssl_verify_true(mock_jira_env, monkeypatch):
     monkeypatch.setenv("JT_SSL_VERIFY", "true")
 
     # Clear cache
-    import jira_config
     jira_config.get_jira_session.cache_clear()
 
     assert get_ssl_verify() is True
@@ -17,10 +17,8 @@ def test_ssl_verify_true(mock_jira_env, monkeypatch):
 
 def test_ssl_verify_false(mock_jira_env, monkeypatch):
     """Test that SSL verification cannot be disabled (security fix)."""
-    import pytest
     monkeypatch.setenv("JT_SSL_VERIFY", "false")
 
-    import jira_config
     jira_config.get_jira_session.cache_clear()
 
     # SSL disable should now raise ValueError for security reasons
@@ -34,8 +32,8 @@ def test_ssl_verify_custom_cert(mock_jira_env, tmp_path, monkeypatch):
 
     monkeypatch.setenv("JT_SSL_VERIFY", str(cert_file))
 
-    import jira_config
-    # Note: get_ssl_verify() doesn't have cache, only get_jira_session() does
+    # Note: get_ssl_verify() reads the environment each call; the resolved setting
+    # and get_jira_session() are cached (conftest clears both between tests)
     jira_config.get_jira_session.cache_clear()
 
     ssl_verify = get_ssl_verify()
@@ -48,7 +46,8 @@ def test_ssl_verify_nonexistent_cert_fallback(mock_jira_env, monkeypatch, capsys
     """Test fallback to True when cert path doesn't exist."""
     monkeypatch.setenv("JT_SSL_VERIFY", "/nonexistent/Zscaler.pem")
 
-    # Note: get_ssl_verify() doesn't have cache, it reads from environment each time
+    # Note: get_ssl_verify() reads the environment each time; a missing certificate
+    # path is never cached, so it warns on every call
     # Should print warning and return True
     result = get_ssl_verify()
     assert result is True
@@ -56,3 +55,13 @@ def test_ssl_verify_nonexistent_cert_fallback(mock_jira_env, monkeypatch, capsys
     captured = capsys.readouterr()
     assert "Warning" in captured.out
     assert "does not exist" in captured.out
+
+def test_ssl_verify_cert_created_after_missing_lookup(mock_jira_env, tmp_path, monkeypatch):
+    """A certificate that appears after a failed lookup is used on the next call."""
+    cert_file = tmp_path / "Zscaler.pem"
+    monkeypatch.setenv("JT_SSL_VERIFY", str(cert_file))
+
+    assert get_ssl_verify() is True
+
+    cert_file.write_text("-----BEGIN CERTIFICATE-----\nFAKE CERT FOR TESTING\n-----END CERTIFICATE-----")
+    assert get_ssl_verify() == str(cert_file.resolve())
@@ -1,4 +1,6 @@
 """Integration tests ensuring jpt.py works correctly after migration."""
+import json
+
 import pytest
 import responses
 import sys
@@ -7,13 +9,25 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-@responses.activate
-def test_get_current_sprint_id(mock_jira_env):
+import jira_config
+
+# Issue keys for a two-page sprint (50 + 25), formatted once per module
+SPRINT_ISSUE_KEYS = tuple(f"TEST-{i}" for i in range(75))
+
+@pytest.fixture(scope="module")
+def jpt(jira_env_file):
+    """Import jpt (and build its Jira session) once, against the test .jira_environment."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(jira_config, "DEFAULT_ENV_PATH", jira_env_file)
+        import jpt
+        yield jpt
+
+def test_get_current_sprint_id(jpt, rsps):
     """Test get_current_sprint_id uses session with auth."""
-    import jpt
+    jpt.clear_cache()
 
     url = "https://test.atlassian.net/rest/agile/1.0/board/42/sprint?state=active"
-    responses.add(
+    rsps.add(
         responses.GET,
         url,
         json={"values": [{"id": 123, "name": "Sprint 1", "state": "active"}]},
@@ -23,55 +37,49 @@ def test_get_current_sprint_id(mock_jira_env):
     sprint_id = jpt.get_current_sprint_id()
 
     assert sprint_id == 123
-    assert len(responses.calls) == 1
+    assert len(rsps.calls) == 1
 
     # Verify auth header was sent
-    assert "Authorization" in responses.calls[0].request.headers
+    assert "Authorization" in rsps.calls[0].request.headers
 
-@responses.activate
-def test_get_issues_with_pagination(mock_jira_env):
+def test_get_issues_with_pagination(jpt, rsps):
     """Test get_issues handles pagination correctly."""
-    import jpt
-
     url = "https://test.atlassian.net/rest/agile/1.0/sprint/123/issue"
 
     # First page
-    responses.add(
+    rsps.add(
         responses.GET,
         url,
         json={
             "total": 75,
-            "issues": [{"key": f"TEST-{i}"} for i in range(50)]
+            "issues": [{"key": key} for key in SPRINT_ISSUE_KEYS[:50]]
         },
         status=200
     )
 
     # Second page
-    responses.add(
+    rsps.add(
         responses.GET,
         url,
         json={
             "total": 75,
-            "issues": [{"key": f"TEST-{i}"} for i in range(50, 75)]
+            "issues": [{"key": key} for key in SPRINT_ISSUE_KEYS[50:]]
         },
         status=200
     )
 
     issues = jpt.get_issues(123)
 
-    assert len(issues) == 75
-    assert len(responses.calls) == 2
+    assert tuple(issue["key"] for issue in issues) == SPRINT_ISSUE_KEYS
+    assert len(rsps.calls) == 2
 
-@responses.activate
-def test_jql_search_now_has_retry(mock_jira_env):
+def test_jql_search_now_has_retry(jpt, rsps):
     """Test jql_search now retries via session (bug fix)."""
-    import jpt
-
     url = "https://test.atlassian.net/rest/api/3/search/jql"
 
     # First attempt fails, second succeeds
-    responses.add(responses.POST, url, status=503)
-    responses.add(
+    rsps.add(responses.POST, url, status=503)
+    rsps.add(
         responses.POST,
         url,
         json={"issues": [{"key": "TEST-1"}], "total": 1},
@@ -83,13 +91,10 @@ def test_jql_search_now_has_retry(mock_jira_env):
     assert result is not None
     assert result["total"] == 1
     # Retry should have happened
-    assert len(responses.calls) >= 2
+    assert len(rsps.calls) >= 2
 
-@responses.activate
-def test_auth_applied_to_previously_broken_calls(mock_jira_env):
+def test_auth_applied_to_previously_broken_calls(jpt, rsps):
     """Test that lines 436, 677, 721 now have proper auth (bug fix)."""
-    import jpt
-
     # Simulate the dump_issue flow (line 436)
     url = "https://test.atlassian.net/rest/api/2/issue/TEST-1"
 
@@ -99,7 +104,7 @@ def test_auth_applied_to_previously_broken_calls(mock_jira_env):
         assert "Authorization" in request.headers, "Auth should be present now"
         return (200, {}, '{"key": "TEST-1", "fields": {}}')
 
-    responses.add_callback(
+    rsps.add_callback(
         responses.GET,
         url,
         callback=check_auth,
@@ -109,3 +114,72 @@ def test_auth_applied_to_previously_broken_calls(mock_jira_env):
     # This internally uses session which has auth
     resp = jpt._JIRA_SESSION.get(url, params={"fields": "*all"}, timeout=15)
     assert resp.status_code == 200
+
+
+def test_sprint_added_date_prefers_latest_addition(jpt):
+    """The most recent changelog entry adding the sprint id wins."""
+    issue = {"changelog": {"histories": [
+        {"created": "2024-01-01T10:00:00.000+0000",
+         "items": [{"field": "Sprint", "from": "", "to": "123", "toString": "Sprint 1"}]},
+        {"created": "2024-01-03T10:00:00.000+0000",
+         "items": [{"field": "Sprint", "from": "123", "to": "", "toString": ""}]},
+        {"created": "2024-01-05T10:00:00.000+0000",
+         "items": [{"field": "Sprint", "from": "", "to": "1234, 123", "toString": "Sprint 2, Sprint 1"}]},
+        {"created": "2024-01-06T10:00:00.000+0000",
+         "items": [{"field": "Sprint", "from": "123", "to": "123, 77", "toString": "Sprint 1, Sprint 9"}]},
+    ]}}
+
+    added = jpt.parse_issue_sprint_added_date(issue, 123)
+
+    assert added is not None
+    assert added.day == 5
+
+
+def test_sprint_lookups_cached_until_cleared(jpt, rsps):
+    """Sprint id lookups hit Jira once per process until clear_cache()."""
+    jpt.clear_cache()
+
+    url = "https://test.atlassian.net/rest/agile/1.0/board/42/sprint?state=future"
+    rsps.add(responses.GET, url, json={"values": [{"id": 124, "state": "future"}]}, status=200)
+
+    assert jpt.get_next_sprint_id() == 124
+    assert jpt.get_upcoming_sprint_id() == 124
+    assert len(rsps.calls) == 1
+
+    jpt.clear_cache()
+    assert jpt.get_next_sprint_id() == 124
+    assert len(rsps.calls) == 2
+
+
+def test_jql_search_remembers_accepted_payload_shape(jpt, rsps):
+    """After one search, later searches start with the payload shape Jira accepted."""
+    jpt._JQL_SHAPE_BY_ENDPOINT.clear()
+
+    url = "https://test.atlassian.net/rest/api/3/search/jql"
+
+    def only_query_shape(request):
+        body = json.loads(request.body)
+        if "query" in body and "fields" in body and "maxResults" in body:
+            return (200, {}, '{"issues": [], "total": 0}')
+        return (400, {}, '{"errorMessages": ["bad shape"]}')
+
+    rsps.add_callback(responses.POST, url, callback=only_query_shape, content_type="application/json")
+
+    assert jpt.jql_search({"jql": "project=TEST", "fields": ["summary"]}) is not None
+    assert len(rsps.calls) == 2
+
+    assert jpt.jql_search({"jql": "project=TEST", "fields": ["summary"]}) is not None
+    assert len(rsps.calls) == 3
+
+
+def test_repeated_key_search_is_memoized(jpt, rsps):
+    """Identical key searches within a run hit Jira once."""
+    jpt.clear_cache()
+
+    url = "https://test.atlassian.net/rest/api/3/search/jql"
+    rsps.add(responses.POST, url, json={"issues": [{"key": "EMSS-1"}], "total": 1}, status=200)
+
+    first = jpt.search_issues_by_key(["EMSS-1"], ["summary"])
+    second = jpt.search_issues_by_key(["EMSS-1"], ["summary"])
+    assert first == second
+    assert len(rsps.calls) == 1
@@ -0,0 +1,96 @@
+"""Tests for jpt_menu - in-process tool runs and the report-only "Run All Checks" action."""
+import builtins
+import logging
+import re
+import runpy
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import responses
+
+import jpt_menu
+
+SCRIPT_DIR = Path(jpt_menu.__file__).resolve().parent
+
+
+def test_run_script_resets_tool_state(tmp_path):
+    """A tool's response cache and logging setup do not outlive its run; project modules stay loaded."""
+    import jira_performance
+
+    script = tmp_path / "tool.py"
+    script.write_text(
+        "import logging, sys\n"
+        "import jira_performance\n"
+        f"jira_performance.enable_response_cache({str(tmp_path / 'cache')!r})\n"
+        "logging.basicConfig(level=logging.DEBUG)\n"
+        "sys.exit(3)\n"
+    )
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+
+    assert jpt_menu.run_script(str(script)) == 3
+
+    assert jira_performance._RESPONSE_CACHE["dir"] is None
+    # Kept, with its caches, for the next menu action
+    assert sys.modules["jira_performance"] is jira_performance
+    assert root.handlers == handlers
+    assert root.level == level
+
+
+def test_run_all_checks_reports_in_menu_order(monkeypatch, capsys):
+    """Reports are printed in CHECK_COMMANDS order even when later checks finish first."""
+    def fake_run_check(command):
+        # The first check finishes last
+        time.sleep(0.05 if command is jpt_menu.CHECK_COMMANDS[0] else 0)
+        return (2 if command[0] == "jira_blocked_overview.py" else 0), f"report of {command[0]}\n"
+
+    monkeypatch.setattr(jpt_menu, "_run_check", fake_run_check)
+
+    jpt_menu.run_all_checks()
+
+    out = capsys.readouterr().out
+    headers = re.findall(r"===== (\S+) =====", out)
+    assert headers == [command[0] for command in jpt_menu.CHECK_COMMANDS]
+    assert "Script 'jira_blocked_overview.py' exited with error code 2." in out
+
+
+def test_run_all_checks_uses_report_only_flags():
+    """Checks that can prompt for fixes are started with --report-only."""
+    commands = {command[0]: command[1:] for command in jpt_menu.CHECK_COMMANDS}
+    assert commands["jira_refine_sanity_check.py"] == ("--report-only",)
+    assert commands["jira_ready_sanity_check.py"] == ("--report-only",)
+
+
+UNLABELED_STORY = {"key": "TEST-1", "fields": {"summary": "Story", "issuetype": {"name": "Story"}, "labels": []}}
+UNLABELED_EPIC = {"key": "TEST-2", "fields": {"summary": "Epic", "issuetype": {"name": "Epic"}, "labels": []}}
+
+
+@pytest.mark.parametrize("report_only", [True, False])
+def test_refine_check_report_only_never_prompts(mock_jira_env, rsps, monkeypatch, capsys, report_only):
+    """With --report-only the refine check prints its findings and never calls input()."""
+    rsps.add(responses.GET, re.compile(r".*/rest/agile/1\.0/board/42/issue.*"),
+             json={"issues": [UNLABELED_STORY], "total": 1})
+    rsps.add(responses.GET, re.compile(r".*/rest/agile/1\.0/board/42/configuration"), json={})
+    rsps.add(responses.POST, re.compile(r".*/rest/api/3/search/jql"),
+             json={"issues": [UNLABELED_EPIC], "total": 1})
+
+    prompts = []
+
+    def fake_input(prompt=""):
+        prompts.append(prompt)
+        return "n"
+
+    monkeypatch.setattr(builtins, "input", fake_input)
+    argv = ["jira_refine_sanity_check.py"] + (["--report-only"] if report_only else [])
+    monkeypatch.setattr(sys, "argv", argv)
+
+    runpy.run_path(str(SCRIPT_DIR / "jira_refine_sanity_check.py"), run_name="__main__")
+
+    assert "TEST-1" in capsys.readouterr().out
+    if report_only:
+        assert prompts == []
+    else:
+        # Without the flag the same data does ask whether to fix the missing labels
+        assert prompts
@@ -0,0 +1,34 @@
+"""Tests for jpt_presentation - building the sprint deck."""
+from io import BytesIO
+
+import pytest
+
+pptx = pytest.importorskip("pptx")
+
+import jpt_presentation
+
+
+@pytest.fixture
+def template(tmp_path, monkeypatch):
+    """A blank python-pptx deck standing in for sprint-template.pptx."""
+    template_path = tmp_path / "sprint-template.pptx"
+    pptx.Presentation().save(str(template_path))
+    monkeypatch.setattr(jpt_presentation, "TEMPLATE_PATH", str(template_path))
+    return template_path
+
+
+def test_create_presentation_into_stream(template, tmp_path, monkeypatch):
+    """With stream=..., the deck is written to the stream and nothing lands on disk."""
+    monkeypatch.chdir(tmp_path)
+    grouped = {"nlms": [{"key": "TEST-1", "fields": {"summary": "Story", "status": {"name": "Done"}}}]}
+    out_file = tmp_path / "Sprint 1.pptx"
+    buf = BytesIO()
+
+    jpt_presentation.create_presentation(
+        grouped, "Sprint 1", "2024-01-01", "2024-01-14", filename=str(out_file), stream=buf
+    )
+
+    assert not out_file.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [template.name]
+    prs = pptx.Presentation(BytesIO(buf.getvalue()))
+    assert prs.slides[0].shapes.title.text == "Sprint 1"